@@ -6,9 +6,13 @@ PeptideSequence objects. It allows grouping, indexing, and querying
 sequences by accession or other criteria.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import pandas as pd
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -44,7 +48,9 @@ class SequenceDB:
 
     def unique_accessions(self) -> set[str]:
         "Return a set of all uniques accessions in database."
-        return {acc for acc in self.accessions if acc is not None}
+        accessions = set(self.accessions) # Built in C, None is dropped afterwards
+        accessions.discard(None)
+        return accessions
 
     def n_unique_accessions(self) -> int:
         "Return number of uniques accessions."
@@ -54,12 +60,19 @@ class SequenceDB:
         """
         Return the database as a pandas DataFrame.
         """
-        return pd.DataFrame({
+        import pandas as pd  # lazy import
+
+        # Built in one go from all columns, no column inserted afterwards
+        return pd.DataFrame(self._dataframe_columns(), copy=False)
+
+    def _dataframe_columns(self) -> dict:
+        """Columns of to_dataframe(), in output order."""
+        return {
             "id": self.ids,
             "accession": self.accessions,
             "sequence": self.sequences,
             "ambiguous_il_sequence": self.ambiguous_il_sequences,
-        })
+        }
 
 
 class TargetDB(SequenceDB):
@@ -79,16 +92,15 @@ class TargetDB(SequenceDB):
             return 0.0
         return self.n_targets_with_wildcards() / self.size
 
-    # Modify to_dataframe methode in order to incorporate eventual contain_windcards attribute in output
-    def to_dataframe(self) -> pd.DataFrame:
-        # Start with parent DataFrame
-        df = super().to_dataframe()
+    # Modify to_dataframe columns in order to incorporate eventual contain_windcards attribute in output
+    def _dataframe_columns(self) -> dict:
+        columns = super()._dataframe_columns()
 
-        # Inject contain_wildcard if it exists
+        # Add contain_wildcard if it exists
         if hasattr(self, "contains_wildcards"):
-            df["contain_wildcard"] = self.contains_wildcards
+            columns["contain_wildcard"] = self.contains_wildcards
 
-        return df
+        return columns
 
 
 class QueryDB(SequenceDB):
@@ -1,9 +1,16 @@
 import ahocorasick
+import hashlib
+from collections import OrderedDict
 from typing import List
 
 from microtpct.core.databases import TargetDB, QueryDB
 from microtpct.core.results import Match, MatchResult
 
+# Automata of the last query sets, keyed by a digest of their ids and sequences.
+# Set AUTOMATON_CACHE_SIZE to 0 to disable the cache, clear_automaton_cache() frees it.
+AUTOMATON_CACHE_SIZE = 4
+_automaton_cache: "OrderedDict[bytes, ahocorasick.Automaton]" = OrderedDict()
+
 
 def run_ahocorasick(target_db: TargetDB, query_db: QueryDB) -> MatchResult:
     """
@@ -17,24 +24,62 @@ def run_ahocorasick(target_db: TargetDB, query_db: QueryDB) -> MatchResult:
     - MatchResult: list of Match(query_id, target_id, position)
     """
 
-    # Build automaton from query sequences (ambiguous I/L variants)
-    automaton = _build_automaton(query_db.ids, query_db.ambiguous_il_sequences)
+    # Build automaton from query sequences (ambiguous I/L variants), reused if the same queries come again
+    automaton = _get_automaton(query_db.ids, query_db.ambiguous_il_sequences)
 
     matches: List[Match] = []
 
     # Scan each target sequence and record matches
     for t_id, t_seq in zip(target_db.ids, target_db.ambiguous_il_sequences):
-        for end_idx, (q_id, q_seq) in automaton.iter(t_seq):
-            start = end_idx - len(q_seq) + 1
+        for end_idx, (q_id, q_len) in automaton.iter(t_seq):
+            start = end_idx - q_len + 1
             matches.append(Match(query_id=q_id, target_id=t_id, position=start))
 
     return MatchResult(matches)
 
 
+def clear_automaton_cache() -> None:
+    """Drop all cached automata (e.g. once a long-lived process is done with a query set)."""
+    _automaton_cache.clear()
+
+
+def _get_automaton(query_ids: List[str], sequences: List[str]) -> ahocorasick.Automaton:
+    """
+    Return the automaton of this query set, from the cache if it was
+    already built (least recently used sets are dropped first).
+    """
+    if AUTOMATON_CACHE_SIZE <= 0:
+        _automaton_cache.clear() # Don't keep automata cached before the cache was disabled
+        return _build_automaton(query_ids, sequences)
+
+    key = _query_set_digest(query_ids, sequences)
+
+    automaton = _automaton_cache.get(key)
+    if automaton is not None:
+        _automaton_cache.move_to_end(key)
+        return automaton
+
+    automaton = _build_automaton(query_ids, sequences)
+    _automaton_cache[key] = automaton
+    while len(_automaton_cache) > AUTOMATON_CACHE_SIZE:
+        _automaton_cache.popitem(last=False)
+
+    return automaton
+
+
+def _query_set_digest(query_ids: List[str], sequences: List[str]) -> bytes:
+    # Ids are part of the key: they are the automaton payloads
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\n".join(query_ids).encode())
+    h.update(b"\x00")
+    h.update("\n".join(sequences).encode())
+    return h.digest()
+
+
 def _build_automaton(query_ids: List[str], sequences: List[str]) -> ahocorasick.Automaton:
     A = ahocorasick.Automaton()
     for q_id, seq in zip(query_ids, sequences):
-        A.add_word(seq, (q_id, seq))
+        A.add_word(seq, (q_id, len(seq))) # Length stored, no len() per hit
     A.make_automaton()
     return A
 
@@ -8,11 +8,13 @@ This pipeline is interface-agnostic.
 """
 
 from asyncio.log import logger
+import gc
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Literal, List, Dict
 
 from microtpct.io.readers import read_file, SequenceRole
-from microtpct.io.validators import validate_target_input, validate_query_input, validates_wildcards
+from microtpct.io.validators import validate_target_inputs_batch, validate_query_inputs_batch, validates_wildcards
 from microtpct.io.converters import build_database
 from microtpct.core.databases import TargetDB
 
@@ -66,24 +68,26 @@ def run_pipeline(
 
     # Read inputs
     logger.info(f"Reading target file: {target_file}")
-    target_inputs = list(
-        read_file(target_file, 
-                  role=SequenceRole.TARGET, 
-                  format=target_format, 
-                  sep = target_separator,
-                  columns = target_columns
-                  )
-    )
+    with _paused_gc():
+        target_inputs = list(
+            read_file(target_file, 
+                      role=SequenceRole.TARGET, 
+                      format=target_format, 
+                      sep = target_separator,
+                      columns = target_columns
+                      )
+        )
 
     logger.info(f"Reading query file: {query_file}")
-    query_inputs = list(
-        read_file(query_file, 
-                  role=SequenceRole.QUERY, 
-                  format=query_format, 
-                  sep = query_separator,
-                  columns = query_columns
-                  )
-    )
+    with _paused_gc():
+        query_inputs = list(
+            read_file(query_file, 
+                      role=SequenceRole.QUERY, 
+                      format=query_format, 
+                      sep = query_separator,
+                      columns = query_columns
+                      )
+        )
 
     logger.info(f"Loaded {len(target_inputs)} target sequences")
     logger.info(f"Loaded {len(query_inputs)} query peptides")
@@ -109,17 +113,10 @@ def run_pipeline(
 
     logger.info("Validating target inputs")
 
-    # Validate target input and return True if object contain wildcards
-    n_with_wildcards = 0
-
-    for obj in target_inputs:
-        wildcards_detected = validate_target_input(obj, wildcards)
-
-        if wildcards_detected:
-            n_with_wildcards += 1
-
-        if effective_allow_wildcard:
-            object.__setattr__(obj, "contain_wildcards", wildcards_detected)
+    # Validate target inputs, True for each object that contain wildcards
+    # (kept aside, Input objects are slotted and cannot get new attributes)
+    contains_wildcards = validate_target_inputs_batch(target_inputs, wildcards, normalized=True)
+    n_with_wildcards = sum(contains_wildcards)
 
 
     # Inform user about detected wildcards according to matching mode
@@ -142,8 +139,7 @@ def run_pipeline(
     
 
     logger.info("Validating query inputs")
-    for obj in query_inputs:
-        validate_query_input(obj)
+    validate_query_inputs_batch(query_inputs, normalized=True)
 
     logger.info("All inputs are valid")
     
@@ -154,7 +150,7 @@ def run_pipeline(
     target_db = build_database(target_inputs, role=SequenceRole.TARGET)
 
     if effective_allow_wildcard: # Add special attribute and method if wildcard search enable
-        _inject_wildcard_metadata(target_db, target_inputs)
+        _inject_wildcard_metadata(target_db, contains_wildcards)
 
     logger.info("Building query database")
     query_db = build_database(query_inputs, role=SequenceRole.QUERY)
@@ -224,13 +220,8 @@ def run_pipeline(
 
     return result_file, stats_file
 
-def _inject_wildcard_metadata(target_db, target_inputs):
-    contains_wildcard = [
-        getattr(obj, "contain_wildcards")
-        for obj in target_inputs
-    ]
-
-    object.__setattr__(target_db, "contains_wildcards", contains_wildcard)
+def _inject_wildcard_metadata(target_db, contains_wildcards):
+    object.__setattr__(target_db, "contains_wildcards", contains_wildcards)
 
     from types import MethodType
 
@@ -244,4 +235,21 @@ def _inject_wildcard_metadata(target_db, target_inputs):
             accessions=[self.accessions[i] for i in indices],
         )
 
-    target_db.get_wildcard_targets = MethodType(_get_wildcard_targets, target_db)
\ No newline at end of file
+    target_db.get_wildcard_targets = MethodType(_get_wildcard_targets, target_db)
+
+
+@contextmanager
+def _paused_gc():
+    """
+    Disable the cyclic garbage collector while bulk-loading Input objects.
+
+    Millions of small long-lived objects otherwise trigger repeated full
+    collections that only rescan the growing list without freeing anything.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -5,13 +5,18 @@ This module defines lightweight containers to store and analyze
 peptide-to-protein matching results produced by the matching engines.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-import pandas as pd
-from typing import Dict, List, Iterable, Set
+import numpy as np
+from typing import Dict, List, Iterable, Set, Tuple, TYPE_CHECKING
 from statistics import mean
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Match object
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True) # Slots: no per-instance __dict__, engines can emit millions of matches
 class Match:
     """
     Single peptide-to-protein match.
@@ -48,6 +53,7 @@ class MatchResult:
         # Lazy-built indexes (created on demand)
         self._by_query: Dict[str, List[Match]] | None = None
         self._by_target: Dict[str, List[Match]] | None = None
+        self._unique_target_counts: Dict[str, int] | None = None
 
 
     # Basic accessors
@@ -64,15 +70,39 @@ class MatchResult:
 
     # Help to extract results at the end 
 
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the matches as three parallel numpy arrays.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (query_ids, target_ids, positions), ids as object arrays and
+            positions as int64, in match order.
+        """
+        n = len(self._matches)
+
+        query_ids = np.empty(n, dtype=object)
+        target_ids = np.empty(n, dtype=object)
+        query_ids[:] = [m.query_id for m in self._matches]
+        target_ids[:] = [m.target_id for m in self._matches]
+        positions = np.fromiter((m.position for m in self._matches), dtype=np.int64, count=n)
+
+        return query_ids, target_ids, positions
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Return the matching results as a pandas DataFrame.
         One row per peptide-to-protein match.
         """
+        import pandas as pd  # lazy import
+
+        query_ids, target_ids, positions = self.arrays()
+
         return pd.DataFrame({
-            "query_id": [m.query_id for m in self._matches],
-            "target_id": [m.target_id for m in self._matches],
-            "position": [m.position for m in self._matches]
+            "query_id": query_ids,
+            "target_id": target_ids,
+            "position": positions,
             })
 
 
@@ -130,13 +160,34 @@ class MatchResult:
         """Set of unique target IDs matched by a peptide."""
         return {m.target_id for m in self.matches_for_query(query_id)}
 
+    def unique_target_counts(self) -> Dict[str, int]:
+        """
+        Number of distinct proteins matched by each matched peptide.
+
+        Built once and cached, so filtering all queries on it (e.g. the
+        non-proteotypic ones) is a single pass over the matches.
+
+        Returns
+        -------
+        dict
+            Mapping:
+                query_id -> number of distinct target IDs
+        """
+        if self._unique_target_counts is None:
+            self._unique_target_counts = {
+                qid: len({m.target_id for m in ms}) for qid, ms in self.by_query().items()
+            }
+
+        return self._unique_target_counts
+
     def n_unique_targets_for_query(self, query_id: str) -> int:
         """
         Number of distinct proteins matched by a peptide.
 
-        This is a key quantity for proteotypicity.
+        This is a key quantity for proteotypicity. Looked up in the cached
+        unique_target_counts(), so calling it for every query stays linear.
         """
-        return len(self.unique_targets_for_query(query_id))
+        return self.unique_target_counts().get(query_id, 0)
 
     def peptides_with_no_match(self, all_query_ids: Iterable[str]) -> List[str]:
         """
@@ -152,11 +203,17 @@ class MatchResult:
         list of str
             Peptide IDs with zero matches.
         """
-        matched = set(self.by_query().keys())
+        matched = self.by_query()
         return [qid for qid in all_query_ids if qid not in matched]
 
     # ---- Per-query statistics (unique queries only) ----
 
+    def n_unique_queries(self) -> int:
+        """Number of distinct queries with at least one match."""
+        if self._by_query is not None:
+            return len(self._by_query)
+        return len({m.query_id for m in self._matches})
+
     def matches_per_unique_query(self) -> list[int]:
         return [len(ms) for ms in self.by_query().values()]
 
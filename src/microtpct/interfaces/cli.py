@@ -98,9 +98,9 @@ class PipelineRunner:
             If the file does not exist or is not a file.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise click.BadParameter(f"File not found: {file_path}")
-        if not path.is_file():
+        if not path.is_file(): # Single stat() for the usual case
+            if not path.exists():
+                raise click.BadParameter(f"File not found: {file_path}")
             raise click.BadParameter(f"Not a file: {file_path}")
         return path.resolve()
 
@@ -134,9 +134,9 @@ class PipelineRunner:
         return datetime.now()
 
     def manage_output_path(self) -> None:
-        ts = self._timestamp()
-        self.result_file = self.output_path / f"microtpct_matching_result_{ts.strftime("%Y%m%d_%H%M%S")}.{self.ext}"
-        self.stats_file  = self.output_path / f"microtpct_statistics_{ts.strftime("%Y%m%d_%H%M%S")}.{self.ext}"
+        stamp = self._timestamp().strftime("%Y%m%d_%H%M%S")
+        self.result_file = self.output_path / f"microtpct_matching_result_{stamp}.{self.ext}"
+        self.stats_file  = self.output_path / f"microtpct_statistics_{stamp}.{self.ext}"
         return
 
     def format_wildcard(self) -> None:
@@ -4,7 +4,7 @@ Conversion utilities for MicroTPCT.
 This module converts validated input schemas into
 clean core biological sequence databases objects.
 """
-from typing import Iterable
+from typing import Iterable, Sequence
 from microtpct.core.databases import TargetDB, QueryDB
 from microtpct.io.schema import TargetInput, QueryInput
 from microtpct.io.readers import SequenceRole
@@ -35,18 +35,42 @@ def build_database(
     """
 
     sequences = []
-    ambiguous = []
     accessions = []
 
     for obj in inputs:
         sequences.append(obj.sequence)
-        ambiguous.append(il_to_j(obj.sequence))
         accessions.append(obj.accession)
 
+    return build_database_from_columns((accessions, sequences), role)
+
+
+def build_database_from_columns(
+    columns: tuple[Sequence[str], Sequence[str]],
+    role: SequenceRole,
+) -> TargetDB | QueryDB:
+    """
+    Build a SequenceDB straight from (accessions, sequences) columns,
+    as returned by readers.read_file_columnar().
+
+    Returns
+    -------
+    TargetDB or QueryDB
+    """
+
+    accessions, sequences = columns
+
+    # Lists (from build_database or the readers) are used as is, no second copy of the columns
+    if not isinstance(accessions, list):
+        accessions = list(accessions)
+    if not isinstance(sequences, list):
+        sequences = list(sequences)
+
+    ambiguous = [il_to_j(seq) for seq in sequences]
+
     n = len(sequences)
 
     # Choose DB type and ID prefix
-    if role == SequenceRole.TARGET:
+    if role is SequenceRole.TARGET:
         ids = generate_ids("T", n)
         return TargetDB(
             ids=ids,
@@ -55,7 +79,7 @@ def build_database(
             accessions=accessions
         )
 
-    elif role == SequenceRole.QUERY:
+    elif role is SequenceRole.QUERY:
         ids = generate_ids("Q", n)
         return QueryDB(
             ids=ids,
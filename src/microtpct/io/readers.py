@@ -1,6 +1,12 @@
+import os
 from pathlib import Path
 from enum import Enum
+from collections import deque
+from itertools import chain
 from typing import Iterator, Optional, Dict, Sequence
+
+import numpy as np
+
 from microtpct.io.schema import TargetInput, QueryInput
 from microtpct.utils import setup_logger
 
@@ -16,6 +22,13 @@ class SequenceRole(Enum):
     QUERY = "query"
 
 
+# Input class built for each role
+ROLE_INPUT_CLASSES = {
+    SequenceRole.TARGET: TargetInput,
+    SequenceRole.QUERY: QueryInput,
+}
+
+
 # Base reader
 class BaseReader:
     """
@@ -26,6 +39,11 @@ class BaseReader:
     def __init__(self, file_path: str, role: SequenceRole):
         self.file_path = Path(file_path)
         self.role = role
+
+        # Resolve the Input class once, instead of dispatching on role for each record
+        self._input_cls = ROLE_INPUT_CLASSES.get(role)
+        if self._input_cls is None:
+            raise ValueError(f"Unknown role '{role}' for file {self.file_path}")
     
     def _check_file_exists(self) -> bool:
         if not self.file_path.exists():
@@ -40,48 +58,153 @@ class BaseReader:
         """
         raise NotImplementedError("read() must be implemented by the concrete reader.")
 
+    def read_columns(self) -> tuple[list, list]:
+        """
+        Read the whole file as two columns (accessions, sequences).
+
+        Generic version going through read(). Readers able to fill the
+        columns without building Input objects override it.
+        """
+        accessions = []
+        sequences = []
+        for obj in self.read():
+            accessions.append(obj.accession)
+            sequences.append(obj.sequence)
+        return accessions, sequences
+
 
 # FASTA reader
 class FastaReader(BaseReader):
     """
-    FASTA reader using Biopython SeqIO.
+    FASTA reader.
+
+    Regular files are memory-mapped and cut into records by a byte scan
+    (see _read_fasta_mmap()). Anything else (pipes, ...) is streamed with
+    Biopython SimpleFastaParser.
     Produces TargetInput or QueryInput depending on the role.
     """
 
     def read(self) -> Iterator:
         if not self._check_file_exists():
             return
-        
+
+        if not self.file_path.is_file():
+            yield from self._read_stream()
+            return
+
+        try:
+            identifiers, sequences = _read_fasta_mmap(self.file_path)
+        except Exception as e:
+            logger.error(f"Error reading FASTA ({self.file_path}): {e}")
+            return
+
+        for identifier, sequence in zip(identifiers, sequences):
+            yield self._build_input(identifier, sequence)
+
+    def read_columns(self) -> tuple[list, list]:
+        if not self._check_file_exists():
+            return [], []
+
+        if not self.file_path.is_file():
+            return super().read_columns()
+
         try:
-            from Bio import SeqIO # Only if needed (optimization)
+            identifiers, sequences = _read_fasta_mmap(self.file_path)
+        except Exception as e:
+            logger.error(f"Error reading FASTA ({self.file_path}): {e}")
+            return [], []
+
+        return [self._accession(identifier) for identifier in identifiers], sequences
+
+    def _read_stream(self) -> Iterator:
+        try:
+            from Bio.SeqIO.FastaIO import SimpleFastaParser # Only if needed (optimization)
         except ImportError:
             logger.error("Biopython is required for FASTA parsing. Please install biopython.")
             return
 
         try:
-            for record in SeqIO.parse(str(self.file_path), "fasta"):
-                input_obj = self._build_input(record.id, str(record.seq))
-                if input_obj:
-                    yield input_obj
+            with open(os.fspath(self.file_path), buffering=FASTA_BUFFER_SIZE) as handle:
+                # Sequences come out already joined and without whitespace, only case is normalized here
+                for title, sequence in SimpleFastaParser(handle):
+                    yield self._build_input(title.split(None, 1)[0], sequence.upper())
         except Exception as e:
             logger.error(f"Error reading FASTA ({self.file_path}): {e}")
 
-    def _build_input(self, header: str, sequence: str) -> Optional[object]:
+    @staticmethod
+    def _accession(header: str) -> str:
+        # Accession is the second "|" field (UniProt: db|ACCESSION|ENTRY_NAME)
+        start = header.find("|")
+        if start == -1:
+            return header # No pipe, the whole identifier is the accession
+        end = header.find("|", start + 1)
+        return header[start + 1:] if end == -1 else header[start + 1:end]
+
+    def _build_input(self, header: str, sequence: str) -> TargetInput | QueryInput:
         """
         Build the Input object based on the role.
-        Performs light normalization (strip, upper).
+        The sequence is expected to be already normalized by read().
         """
-        accession = header.split("|")[1]
-        sequence = sequence.strip().upper() # Normalization
-        if self.role == SequenceRole.TARGET:
-            return TargetInput(accession=accession, sequence=sequence)
-        
-        elif self.role == SequenceRole.QUERY:
-            return QueryInput(accession=accession, sequence=sequence)
-        
-        else:
-            logger.warning(f"Unknown role '{self.role}' for sequence {header}")
-            return None
+        return self._input_cls(accession=self._accession(header), sequence=sequence)
+
+
+# Read buffer of streamed FASTA files (pipes, ...), large reads instead of 8 KB ones
+FASTA_BUFFER_SIZE = 10 * 1024 * 1024
+
+# Bytes dropped from FASTA sequence lines (line breaks and blanks)
+_FASTA_WHITESPACE = b" \t\r\n\v\f"
+
+
+def _read_fasta_mmap(file_path: Path) -> tuple[list, list]:
+    """
+    Parse a FASTA file in one scan of its bytes.
+
+    The file is memory-mapped and record starts ('>' at the beginning of a
+    line) and title ends are located with numpy over the whole buffer. Each
+    sequence is then cut out of the map and cleaned by a single
+    bytes.translate() call, instead of going through it line by line.
+
+    Returns
+    -------
+    tuple of (identifiers, sequences)
+        First word of each title line, and the upper-cased sequences.
+
+    Raises
+    ------
+    ValueError
+        If a title line is empty.
+    """
+    import mmap
+
+    identifiers = []
+    sequences = []
+
+    with open(file_path, "rb", buffering=0) as handle: # Only mapped, never read through the handle
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return identifiers, sequences # Empty files cannot be mapped
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+
+            starts = np.flatnonzero(buf == 0x3E) # '>'
+            starts = starts[(starts == 0) | (buf[starts - 1] == 0x0A)] # Only at line starts
+            newlines = np.append(np.flatnonzero(buf == 0x0A), size)
+
+            title_ends = newlines[np.searchsorted(newlines, starts)]
+            ends = np.append(starts[1:], size)
+
+            del buf # The map cannot be closed while numpy still exports it
+
+            for start, title_end, end in zip(starts.tolist(), title_ends.tolist(), ends.tolist()):
+                title = mm[start + 1:title_end].split(None, 1)
+                if not title:
+                    raise ValueError(f"Empty FASTA header at byte offset {start}")
+
+                identifiers.append(title[0].decode())
+                sequences.append(mm[title_end + 1:end].translate(None, _FASTA_WHITESPACE).decode().upper())
+
+    return identifiers, sequences
 
 
 class AbstractPandasReader(BaseReader):
@@ -107,6 +230,9 @@ class AbstractPandasReader(BaseReader):
         "sequence": "sequence",
     }
 
+    # Number of threads building Input objects from chunks (see TabularReader)
+    workers: int = 1
+
     def __init__(
         self,
         file_path: str,
@@ -115,38 +241,40 @@ class AbstractPandasReader(BaseReader):
     ):
         super().__init__(file_path, role)
         self.columns = columns or self.PROLINE_COLUMNS
+        self._required_columns = tuple(self.columns.values())
 
     # Public API
     def read(self) -> Iterator:
-        if not self._check_file_exists():
-            return
-
-        try:
-            import pandas as pd  # lazy import
-        except ImportError:
-            logger.error("Pandas is required for tabular/XLSX parsing. Please install pandas.")
+        chunks = self._checked_chunks()
+        if chunks is None:
             return
 
         try:
-            df = self._load_dataframe()
+            if self.workers > 1:
+                yield from self._inputs_from_chunks_parallel(chunks)
+            else:
+                for df in chunks:
+                    yield from self._inputs_from_dataframe(df)
         except Exception as e:
             logger.error(f"Error reading file ({self.file_path}): {e}")
-            return
 
-        if not self._check_required_columns(df.columns):
-            return
+    def read_columns(self) -> tuple[list, list]:
+        accessions = []
+        sequences = []
 
-        for record in df.itertuples(index=False):
-            try:
-                accession_val = getattr(record, self.columns["accession"])
-                sequence_val = getattr(record, self.columns["sequence"])
-            except AttributeError as e:
-                logger.error(f"Column access error in {self.file_path}: {e}")
-                continue
+        chunks = self._checked_chunks()
+        if chunks is None:
+            return accessions, sequences
+
+        try:
+            for df in chunks:
+                chunk_accessions, chunk_sequences = self._columns_from_dataframe(df)
+                accessions.extend(chunk_accessions)
+                sequences.extend(chunk_sequences)
+        except Exception as e:
+            logger.error(f"Error reading file ({self.file_path}): {e}")
 
-            input_obj = self._build_input(accession_val, sequence_val)
-            if input_obj:
-                yield input_obj
+        return accessions, sequences
 
     # Hooks for subclasses
     def _load_dataframe(self):
@@ -157,16 +285,97 @@ class AbstractPandasReader(BaseReader):
         raise NotImplementedError("_load_dataframe() must be implemented by subclasses.")
 
     # Internal helpers
+    def _checked_chunks(self) -> Optional[Iterator]:
+        """
+        Load the file and return an iterator over its DataFrame chunks, or
+        None (after logging) if it cannot be read or misses required columns.
+        """
+        if not self._check_file_exists():
+            return None
+
+        try:
+            import pandas as pd  # lazy import
+        except ImportError:
+            logger.error("Pandas is required for tabular/XLSX parsing. Please install pandas.")
+            return None
+
+        try:
+            data = self._load_dataframe()
+
+            # _load_dataframe() may return a single DataFrame or an iterator of chunks
+            chunks = iter([data] if isinstance(data, pd.DataFrame) else data)
+
+            first = next(chunks, None)
+        except Exception as e:
+            logger.error(f"Error reading file ({self.file_path}): {e}")
+            return None
+
+        if first is None or not self._check_required_columns(first.columns):
+            return None
+
+        return chain([first], chunks)
+
+    def _columns_from_dataframe(self, df) -> tuple:
+        """
+        Return the accession and sequence columns of df as object arrays.
+        Normalization (strip, upper) is done once by pandas string methods.
+        """
+        # Empty cells are read as pd.NA by the "string" dtype, hand them over as None
+        accessions = df[self.columns["accession"]].astype(object)
+        accessions = accessions.where(accessions.notna(), None).to_numpy(dtype=object)
+
+        # Empty sequences become "" (not "nan" or "<NA>") and fail validation as empty
+        sequences = (
+            df[self.columns["sequence"]]
+            .fillna("")
+            .astype(str)
+            .str.strip()
+            .str.upper()
+            .to_numpy(dtype=object)
+        )
+
+        return accessions, sequences
+
+    def _inputs_from_dataframe(self, df) -> Iterator:
+        """
+        Yield Input objects from the accession and sequence columns of df.
+        """
+        accessions, sequences = self._columns_from_dataframe(df)
+        input_cls = self._input_cls
+
+        for accession, sequence in zip(accessions, sequences):
+            yield input_cls(accession=accession, sequence=sequence)
+
+    def _inputs_from_chunks_parallel(self, chunks) -> Iterator:
+        """
+        Build Input objects of several chunks in a thread pool while the next
+        chunks are being parsed. Order is preserved and at most `workers`
+        chunks are in flight.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+
+            for df in chunks:
+                pending.append(executor.submit(self._build_chunk, df))
+                if len(pending) >= self.workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    def _build_chunk(self, df) -> list:
+        return list(self._inputs_from_dataframe(df))
+
     def _check_required_columns(self, available_columns: Sequence[str]) -> bool:
         """Check that all required columns are present in the dataframe."""
-        required = set(self.columns.values())
-        available = set(available_columns)
+        missing = [col for col in self._required_columns if col not in available_columns]
 
-        missing = required - available
         if missing:
             logger.error(
-                f"Missing required columns in {self.file_path}: {sorted(missing)}. "
-                f"Available columns: {sorted(available)}"
+                f"Missing required columns in {self.file_path}: {sorted(set(missing))}. "
+                f"Available columns: {sorted(set(available_columns))}"
             )
             return False
 
@@ -174,22 +383,13 @@ class AbstractPandasReader(BaseReader):
 
     def _build_input(
         self, accession: str, sequence: str
-    ) -> Optional[object]:
+    ) -> TargetInput | QueryInput:
         """
         Build the Input object based on the role.
-        Performs light normalization (strip, upper).
+        The sequence is expected to be already stripped (see _iter_records()),
+        only case is normalized here.
         """
-        sequence = str(sequence).strip().upper()
-
-        if self.role == SequenceRole.TARGET:
-            return TargetInput(accession=accession, sequence=sequence)
-
-        elif self.role == SequenceRole.QUERY:
-            return QueryInput(accession=accession, sequence=sequence)
-
-        else:
-            logger.warning(f"Unknown role '{self.role}' for sequence {id}")
-            return None
+        return self._input_cls(accession=accession, sequence=sequence.upper())
 
 
 # Tabular reader
@@ -200,46 +400,231 @@ class TabularReader(AbstractPandasReader):
     By default, expects Proline-like headers:
         - accession
         - sequence
+
+    Only the accession and sequence columns are parsed, as strings.
+    If chunksize is given, the file is read and converted chunk by chunk.
+    With workers > 1, chunks are converted by a thread pool while the next
+    ones are parsed (chunksize defaults to DEFAULT_CHUNKSIZE in that case).
     """
 
+    DEFAULT_CHUNKSIZE = 100_000
+
     def __init__(
         self,
         file_path: str,
         role: SequenceRole,
         sep: str = ",",
         columns: Optional[Dict[str, str]] = None,
+        chunksize: Optional[int] = None,
+        workers: int = 1,
     ):
         super().__init__(file_path, role, columns)
         self.sep = sep
+        self.workers = workers
+        self.chunksize = chunksize if chunksize or workers <= 1 else self.DEFAULT_CHUNKSIZE
 
     def _load_dataframe(self):
         import pandas as pd
-        return pd.read_csv(str(self.file_path), sep=self.sep)
+
+        wanted = self._required_columns
+
+        # Header only, so that missing columns are reported by read() with the full column list
+        header = pd.read_csv(str(self.file_path), sep=self.sep, nrows=0)
+        if not all(col in header.columns for col in wanted):
+            return header
+
+        return pd.read_csv(
+            str(self.file_path),
+            sep=self.sep,
+            usecols=list(set(wanted)),
+            dtype={col: "string" for col in wanted},
+            engine="c",
+            memory_map=True,
+            chunksize=self.chunksize,
+        )
 
 
 # XLSX reader
 class XlsxReader(AbstractPandasReader):
     """
-    Excel (.xlsx) format reader using pandas.read_excel.
+    Excel (.xlsx) format reader.
 
     By default, expects Proline-like headers:
         - accession
         - sequence
+
+    Rows are streamed straight into Input objects, without building an
+    intermediate DataFrame. The calamine engine is used when python-calamine
+    is installed, otherwise the workbook is opened with openpyxl in read-only
+    mode. Any other pandas engine passed through `engine` falls back to
+    pandas.read_excel.
     """
 
+    # Engines able to stream rows without pandas
+    STREAMING_ENGINES = ("calamine", "openpyxl")
+
     def __init__(
         self,
         file_path: str,
         role: SequenceRole,
         sheet_name: int | str = 0,
         columns: Optional[Dict[str, str]] = None,
+        engine: Optional[str] = None,
     ):
         super().__init__(file_path, role, columns)
         self.sheet_name = sheet_name
+        self.engine = engine
+
+    # Public API
+    def read(self) -> Iterator:
+        if self.engine is not None and self.engine not in self.STREAMING_ENGINES:
+            yield from super().read()
+            return
+
+        for accession, sequence in self._iter_records():
+            yield self._build_input(accession, sequence)
+
+    def read_columns(self) -> tuple[list, list]:
+        if self.engine is not None and self.engine not in self.STREAMING_ENGINES:
+            return super().read_columns()
+
+        # Cells go straight into the columns, no Input object per row
+        accessions = []
+        sequences = []
+        for accession, sequence in self._iter_records():
+            accessions.append(accession)
+            sequences.append(sequence)
+
+        return accessions, [seq.upper() for seq in sequences]
 
     def _load_dataframe(self):
         import pandas as pd
-        return pd.read_excel(str(self.file_path), sheet_name=self.sheet_name)
+        return pd.read_excel(str(self.file_path), sheet_name=self.sheet_name, engine=self.engine)
+
+    # Internal helpers
+    def _iter_records(self) -> Iterator[tuple]:
+        """
+        Yield the (accession, sequence) cells of each non blank row, the
+        sequence as a stripped string (there is no column-wide strip here).
+        """
+        if not self._check_file_exists():
+            return
+
+        rows = self._iter_rows()
+
+        try:
+            header = [str(cell) if cell is not None else "" for cell in next(rows, None) or ()]
+        except Exception as e:
+            logger.error(f"Error reading file ({self.file_path}): {e}")
+            return
+
+        try:
+            if not self._check_required_columns(header):
+                return
+
+            acc_idx = header.index(self.columns["accession"])
+            seq_idx = header.index(self.columns["sequence"])
+
+            for row in rows:
+                # Skip blank rows (trailing rows of read-only sheets, etc.)
+                if not any(cell not in (None, "") for cell in row):
+                    continue
+
+                # Blank cells are None with openpyxl and "" with calamine, never "None"
+                sequence = row[seq_idx]
+                if sequence is None:
+                    sequence = ""
+                elif not isinstance(sequence, str):
+                    sequence = str(sequence)
+
+                yield row[acc_idx], sequence.strip()
+        finally:
+            rows.close()
+
+    def _iter_rows(self) -> Iterator[Sequence]:
+        """
+        Yield the sheet rows as sequences of cell values, header row first.
+        """
+        if self.engine in (None, "calamine"):
+            try:
+                from python_calamine import CalamineWorkbook
+            except ImportError:
+                if self.engine == "calamine":
+                    raise
+                logger.debug("python-calamine not available, falling back to openpyxl read-only mode")
+            else:
+                wb = CalamineWorkbook.from_path(str(self.file_path))
+                if isinstance(self.sheet_name, str):
+                    sheet = wb.get_sheet_by_name(self.sheet_name)
+                else:
+                    sheet = wb.get_sheet_by_index(self.sheet_name)
+
+                yield from sheet.iter_rows()
+                return
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(str(self.file_path), read_only=True, data_only=True)
+        try:
+            if isinstance(self.sheet_name, str):
+                ws = wb[self.sheet_name]
+            else:
+                ws = wb.worksheets[self.sheet_name]
+
+            yield from ws.iter_rows(values_only=True)
+        finally:
+            wb.close()
+
+
+# Format dispatch tables used by read_file()
+EXTENSION_FORMATS: Dict[str, str] = {
+    ".fasta": "fasta",
+    ".fa": "fasta",
+    ".faa": "fasta",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".txt": "tsv",
+    ".xlsx": "xlsx",
+}
+
+TABULAR_SEPARATORS: Dict[str, str] = {
+    ".csv": ",",
+    ".tsv": "\t",
+    ".txt": "\t",
+}
+
+
+def _fasta_kwargs(file_path: str, ext: str, kwargs: dict) -> dict:
+    return {} # FastaReader takes no option
+
+
+def _tabular_kwargs(file_path: str, ext: str, kwargs: dict) -> dict:
+    # Deduce separator from extension unless explicitly provided
+    if kwargs.get("sep") is None:
+        if ext in TABULAR_SEPARATORS:
+            kwargs["sep"] = TABULAR_SEPARATORS[ext]
+        else:
+            # fallback (should not really happen if format deduction worked)
+            kwargs["sep"] = ","
+            logger.warning(
+                f"Could not deduce separator from extension '{ext}'. "
+                f"Falling back to ',' for file {file_path}."
+            )
+    return kwargs
+
+
+def _xlsx_kwargs(file_path: str, ext: str, kwargs: dict) -> dict:
+    kwargs.pop("sep", None) # No separator needed
+    return kwargs
+
+
+# format -> (reader class, function preparing the reader kwargs)
+FORMAT_READERS = {
+    "fasta": (FastaReader, _fasta_kwargs),
+    "csv": (TabularReader, _tabular_kwargs),
+    "tsv": (TabularReader, _tabular_kwargs),
+    "xlsx": (XlsxReader, _xlsx_kwargs),
+}
 
 
 def read_file(
@@ -275,54 +660,57 @@ def read_file(
         Iterator over Input objects.
     """
 
-    file_path_obj = Path(file_path)
-    ext = file_path_obj.suffix.lower()
+    reader = _make_reader(file_path, role, format, kwargs)
+    if reader is None:
+        return iter([])
+
+    return reader.read()
+
+
+def read_file_columnar(
+    file_path: str,
+    role: SequenceRole,
+    format: Optional[str] = None,
+    **kwargs,
+) -> tuple[list, list]:
+    """
+    Same as read_file(), but return the whole file as two columns
+    (accessions, sequences) instead of an iterator of Input objects.
+
+    Meant to be passed to converters.build_database_from_columns(), which
+    skips the per-record Input objects entirely.
+
+    Returns
+    -------
+    tuple of (accessions, sequences)
+        Two sequences of equal length. Both are empty if the file cannot be read.
+    """
+    reader = _make_reader(file_path, role, format, kwargs)
+    if reader is None:
+        return [], []
+
+    return reader.read_columns()
+
+
+def _make_reader(file_path: str, role: SequenceRole, format: Optional[str], kwargs: dict) -> Optional[BaseReader]:
+    ext = Path(file_path).suffix.lower()
 
     # Deduce format from extension
     if format is None:
-        if ext in (".fasta", ".fa", ".faa"):
-            format = "fasta"
-        elif ext == ".csv":
-            format = "csv"
-        elif ext in (".tsv", ".txt"):
-            format = "tsv"
-        elif ext == ".xlsx":
-            format = "xlsx"
-        else:
+        format = EXTENSION_FORMATS.get(ext)
+        if format is None:
             logger.error(
                 f"Cannot deduce format from file extension '{ext}' for file {file_path}"
             )
-            return iter([])
+            return None
 
     format = format.lower()
 
     # Instantiate appropriate reader
-    if format == "fasta":
-        reader = FastaReader(file_path, role)
-
-    elif format in ("csv", "tsv"):
-        # Deduce separator from extension unless explicitly provided
-        if "sep" not in kwargs or kwargs["sep"] is None:
-            if ext == ".csv":
-                kwargs["sep"] = ","
-            elif ext in (".tsv", ".txt"):
-                kwargs["sep"] = "\t"
-            else:
-                # fallback (should not really happen if format deduction worked)
-                kwargs["sep"] = ","
-                logger.warning(
-                    f"Could not deduce separator from extension '{ext}'. "
-                    f"Falling back to ',' for file {file_path}."
-                )
-
-        reader = TabularReader(file_path, role, **kwargs)
-
-    elif format == "xlsx":
-        kwargs.pop("sep", None) # No separator needed
-        reader = XlsxReader(file_path, role, **kwargs)
-
-    else:
+    try:
+        reader_cls, prepare_kwargs = FORMAT_READERS[format]
+    except KeyError:
         logger.error(f"Unsupported format '{format}' for file {file_path}")
-        return iter([])
+        return None
 
-    return reader.read()
\ No newline at end of file
+    return reader_cls(file_path, role, **prepare_kwargs(file_path, ext, kwargs))
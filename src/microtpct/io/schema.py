@@ -11,7 +11,7 @@ Validation and biological rules are handled in io/validators.py.
 from dataclasses import dataclass, field # dataclasses allows auto-creates __init__, __repr__, etc.
 
 
-@dataclass(frozen=True) # Frozen to prevent sequence modification (~ read only)
+@dataclass(frozen=True, slots=True) # Frozen to prevent sequence modification (~ read only), slots to drop per-instance __dict__
 class SequenceInput:
     """
     Generic input biological sequence.
@@ -21,14 +21,14 @@ class SequenceInput:
     sequence: str = field(repr=False)  # Avoid printing sequence when object is called
 
 
-@dataclass(frozen=True) # Frozen to prevent sequence modification (~ read only)
+@dataclass(frozen=True, slots=True) # Frozen to prevent sequence modification (~ read only)
 class TargetInput(SequenceInput):
     """Contract for a target input."""
     
     accession: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryInput(TargetInput):
     """Contract for a query input."""
     
@@ -8,7 +8,10 @@ It enforces data completeness, formatting rules and basic
 biological constraints.
 """
 
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Sequence
+
+import numpy as np
 
 from microtpct.io.schema import SequenceInput, TargetInput, QueryInput
 from microtpct.utils import setup_logger
@@ -17,6 +20,17 @@ from microtpct.utils import setup_logger
 
 AMINO_ACIDS = set("GPAVLIMCFYWHKRQNEDST") | set("OU") # Commons amino acids + rares
 
+# Bytes accepted by the batch validators (any case, plus the record separator)
+_RECORD_SEPARATOR = b"\x00"
+_VALID_BYTES = "".join(sorted(AMINO_ACIDS)).encode() + "".join(sorted(AMINO_ACIDS)).lower().encode() + _RECORD_SEPARATOR
+_VALID_BYTES_MASK = np.zeros(256, dtype=bool)
+_VALID_BYTES_MASK[np.frombuffer(_VALID_BYTES, dtype=np.uint8)] = True
+
+# Byte classes produced by the _residue_table() translation
+_INVALID_BYTE = b"\x00"
+_RESIDUE_BYTE = b"\x01"
+_WILDCARD_BYTE = b"\x02"
+
 
 logger = setup_logger(__name__)
 
@@ -24,17 +38,87 @@ logger = setup_logger(__name__)
 # Base validation
 
 def validate_sequence_input(seq: SequenceInput) -> None:
+    sequence = seq.sequence
 
-    if not seq.sequence:
+    if not sequence:
         raise ValueError("SequenceInput.sequence cannot be empty.")
 
-    if not isinstance(seq.sequence, str):
+    if not isinstance(sequence, str):
         raise TypeError("SequenceInput.sequence must be a string.")
 
 
 # Target validation
 
-def validate_target_input(prot: TargetInput, wildcards: Optional[set] = None) -> bool:
+def validate_target_input(prot: TargetInput, wildcards: Optional[set] = None, normalized: bool = False) -> bool:
+    _validate_target_fields(prot)
+
+    # Returns True if wildcard detected, False otherwise
+    return _validate_amino_acid_sequence(
+        prot.sequence,
+        obj_id=prot.accession,
+        wildcards=wildcards,
+        normalized=normalized,
+    )
+
+
+def validate_target_inputs_batch(
+    targets: Sequence[TargetInput],
+    wildcards: Optional[set] = None,
+    normalized: bool = False,
+) -> List[bool]:
+    """
+    Validate many TargetInput at once.
+
+    Same checks as validate_target_input(), but residues of all sequences are
+    scanned in a single pass. Returns, for each target, True if it contains
+    wildcards.
+    """
+    for prot in targets:
+        _validate_target_fields(prot)
+
+    contains_wildcards = [False] * len(targets)
+
+    for i in _records_with_unknown_residues([prot.sequence for prot in targets]):
+        contains_wildcards[i] = _validate_amino_acid_sequence(
+            targets[i].sequence,
+            obj_id=targets[i].accession,
+            wildcards=wildcards,
+            normalized=normalized,
+        )
+
+    return contains_wildcards
+
+
+def validate_target_columns(
+    accessions: Sequence[str],
+    sequences: Sequence[str],
+    wildcards: Optional[set] = None,
+    normalized: bool = False,
+) -> List[bool]:
+    """
+    Validate targets given as (accessions, sequences) columns, as returned by
+    readers.read_file_columnar().
+
+    Same checks as validate_target_inputs_batch(), without Input objects.
+    Returns, for each target, True if it contains wildcards.
+    """
+    _validate_columns(accessions, sequences, "TargetInput")
+
+    contains_wildcards = [False] * len(sequences)
+
+    for i in _records_with_unknown_residues(sequences):
+        contains_wildcards[i] = _validate_amino_acid_sequence(
+            sequences[i],
+            obj_id=accessions[i],
+            wildcards=wildcards,
+            normalized=normalized,
+        )
+
+    return contains_wildcards
+
+
+def _validate_target_fields(prot: TargetInput) -> None:
+    # Exact type check on purpose: QueryInput subclasses TargetInput and must be rejected here
     if type(prot) is not TargetInput:
         raise TypeError(
             f"validate_target_input() expects TargetInput, got {type(prot).__name__}"
@@ -42,67 +126,203 @@ def validate_target_input(prot: TargetInput, wildcards: Optional[set] = None) ->
 
     validate_sequence_input(prot)
 
-    if not prot.accession:
+    accession = prot.accession
+    if not accession:
         raise ValueError("TargetInput.accession cannot be empty.")
 
-    if not isinstance(prot.accession, str):
+    if not isinstance(accession, str):
         raise TypeError("TargetInput.accession must be a string.")
 
-    # Returns True if wildcard detected, False otherwise
-    return _validate_amino_acid_sequence(
-        prot.sequence,
-        obj_id=prot.accession,
-        wildcards=wildcards,
+
+def validate_query_input(pep: QueryInput, normalized: bool = False) -> None:
+    _validate_query_fields(pep)
+
+    # Querys never allow wildcards → strict validation
+    _validate_amino_acid_sequence(
+        pep.sequence,
+        obj_id=pep.accession,
+        show_sequence=True,
+        normalized=normalized,
     )
 
 
-def validate_query_input(pep: QueryInput) -> None:
-    if type(pep) is not QueryInput:
+def validate_query_inputs_batch(queries: Sequence[QueryInput], normalized: bool = False) -> None:
+    """
+    Validate many QueryInput at once.
+
+    Same checks as validate_query_input(), but residues of all sequences are
+    scanned in a single pass.
+    """
+    for pep in queries:
+        _validate_query_fields(pep)
+
+    for i in _records_with_unknown_residues([pep.sequence for pep in queries]):
+        _validate_amino_acid_sequence(
+            queries[i].sequence,
+            obj_id=queries[i].accession,
+            show_sequence=True,
+            normalized=normalized,
+        )
+
+
+def validate_query_columns(
+    accessions: Sequence[str],
+    sequences: Sequence[str],
+    normalized: bool = False,
+) -> None:
+    """
+    Validate queries given as (accessions, sequences) columns, as returned by
+    readers.read_file_columnar().
+
+    Same checks as validate_query_inputs_batch(), without Input objects.
+    """
+    _validate_columns(accessions, sequences, "QueryInput")
+
+    for i in _records_with_unknown_residues(sequences):
+        _validate_amino_acid_sequence(
+            sequences[i],
+            obj_id=accessions[i],
+            show_sequence=True,
+            normalized=normalized,
+        )
+
+
+def _validate_query_fields(pep: QueryInput) -> None:
+    if not isinstance(pep, QueryInput):
         raise TypeError(
             f"validate_query_input() expects QueryInput, got {type(pep).__name__}"
         )
 
     validate_sequence_input(pep)
 
-    if not pep.accession:
+    accession = pep.accession
+    if not accession:
         raise ValueError("QueryInput.accession cannot be empty.")
 
-    if not isinstance(pep.accession, str):
+    if not isinstance(accession, str):
         raise TypeError("QueryInput.accession must be a string.")
 
-    # Querys never allow wildcards → strict validation
-    _validate_amino_acid_sequence(
-        pep.sequence,
-        obj_id=f"{pep.accession} (sequence: {pep.sequence})"
-    )
+
+def _validate_columns(accessions: Sequence[str], sequences: Sequence[str], label: str) -> None:
+    """
+    Field checks of the column validators (non empty strings), with the same
+    messages as the per-object ones. Records are only looked at one by one
+    if a check fails.
+    """
+    if len(accessions) != len(sequences):
+        raise ValueError(
+            f"Got {len(accessions)} accessions for {len(sequences)} sequences."
+        )
+
+    if not all(isinstance(seq, str) and seq for seq in sequences):
+        for seq in sequences:
+            if not seq:
+                raise ValueError("SequenceInput.sequence cannot be empty.")
+            if not isinstance(seq, str):
+                raise TypeError("SequenceInput.sequence must be a string.")
+
+    if not all(isinstance(acc, str) and acc for acc in accessions):
+        for acc in accessions:
+            if not acc:
+                raise ValueError(f"{label}.accession cannot be empty.")
+            if not isinstance(acc, str):
+                raise TypeError(f"{label}.accession must be a string.")
 
 
 def _validate_amino_acid_sequence(
     sequence: str,
     obj_id: str | None = None,
     wildcards: Optional[set] = None,
+    show_sequence: bool = False,
+    normalized: bool = False,
 ) -> bool:
 
-    if wildcards is None:
-        wildcards = set()
+    # Fast path: classify every character with a single bytes.translate() call
+    if sequence.isascii():
+        classes = sequence.encode("ascii").translate(_residue_table(frozenset(wildcards or ())))
+        if _INVALID_BYTE not in classes:
+            return _WILDCARD_BYTE in classes
 
-    invalid = set(sequence.upper()) - AMINO_ACIDS
+    # Invalid (or non ASCII) characters: readers already upper-case sequences, no need to copy them again
+    residues = set(sequence if normalized else sequence.upper())
 
-    if invalid:
-        # All invalid characters are allowed wildcards
-        if invalid.issubset(wildcards):
-            return True
+    # No wildcard, sequence is clean
+    if residues <= AMINO_ACIDS:
+        return False
 
-        id_info = f" for object '{obj_id}'" if obj_id else ""
-        logger.error(
-            f"Invalid amino acids found{id_info}: {', '.join(sorted(invalid))}"
-        )
-        raise ValueError(
-            f"Invalid amino acids found{id_info}: {', '.join(sorted(invalid))}"
-        )
+    # All unknown characters are allowed wildcards
+    if wildcards and residues <= _allowed_alphabet(frozenset(wildcards)):
+        return True
 
-    # No wildcard, sequence is clean
-    return False
+    invalid = residues - AMINO_ACIDS
+
+    # Error message is only built on failure
+    if obj_id and show_sequence:
+        obj_id = f"{obj_id} (sequence: {sequence})"
+    id_info = f" for object '{obj_id}'" if obj_id else ""
+    logger.error(
+        f"Invalid amino acids found{id_info}: {', '.join(sorted(invalid))}"
+    )
+    raise ValueError(
+        f"Invalid amino acids found{id_info}: {', '.join(sorted(invalid))}"
+    )
+
+
+@lru_cache(maxsize=16)
+def _residue_table(wildcards: frozenset) -> bytes:
+    """
+    256-entry bytes.translate() table, computed once per wildcard set.
+
+    Each ASCII byte is mapped to its class, case-insensitively: amino acid,
+    wildcard or invalid.
+    """
+    table = bytearray(256) # Everything invalid by default
+
+    for byte in range(128):
+        char = chr(byte).upper()
+        if char in AMINO_ACIDS:
+            table[byte] = _RESIDUE_BYTE[0]
+        elif char in wildcards:
+            table[byte] = _WILDCARD_BYTE[0]
+
+    return bytes(table)
+
+
+@lru_cache(maxsize=16)
+def _allowed_alphabet(wildcards: frozenset) -> frozenset:
+    """Amino acids plus wildcards, computed once per wildcard set."""
+    return frozenset(AMINO_ACIDS | wildcards)
+
+
+def _records_with_unknown_residues(sequences: List[str]) -> List[int]:
+    """
+    Return the indices of the sequences containing characters outside
+    AMINO_ACIDS (wildcards or invalid residues).
+
+    Sequences are joined into one bytes buffer, valid bytes are dropped by a
+    single bytes.translate() call and, only if something remains, offending
+    positions are mapped back to their record with numpy.
+    """
+    if not sequences:
+        return []
+
+    joined = _RECORD_SEPARATOR.decode().join(sequences)
+
+    if not joined.isascii() or joined.count(_RECORD_SEPARATOR.decode()) != len(sequences) - 1:
+        # Non ASCII (or separator) characters cannot be mapped to byte offsets, check each record
+        return [i for i, seq in enumerate(sequences) if not set(seq.upper()) <= AMINO_ACIDS]
+
+    buffer = joined.encode("ascii")
+
+    if not buffer.translate(None, _VALID_BYTES):
+        return [] # Everything is valid
+
+    lengths = np.fromiter((len(seq) for seq in sequences), dtype=np.int64, count=len(sequences))
+    ends = np.cumsum(lengths + 1) - 1 # Offset of the separator following each record
+
+    invalid_positions = np.flatnonzero(~_VALID_BYTES_MASK[np.frombuffer(buffer, dtype=np.uint8)])
+
+    return np.unique(np.searchsorted(ends, invalid_positions)).tolist()
 
 
 def validates_wildcards(wildcards: set) -> None:
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
-import pandas as pd
+from typing import Literal, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd # Imported lazily where needed, only for annotations here
 
 from microtpct.core.databases import QueryDB, TargetDB
 from microtpct.core.results import MatchResult
@@ -10,17 +16,91 @@ from microtpct.core.results import MatchResult
 
 PathLike = str | Path
 
+# CSV output is written in row chunks through a large file buffer
+CSV_CHUNKSIZE = 100_000
+CSV_BUFFER_SIZE = 1 << 20
+
+# Every value of the matching_type column, stored as a categorical
+MATCHING_TYPES = ("no_match", "strict", "wildcard")
+
+# Analysis name cleanup patterns, compiled once
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9_\-]")
+
 def _sanitize_name(name: str) -> str:
 
     name = name.strip().lower()
-    name = re.sub(r"\s+", "_", name)
-    name = re.sub(r"[^a-zA-Z0-9_\-]", "", name)
+    name = _WHITESPACE_RE.sub("_", name)
+    name = _UNSAFE_CHARS_RE.sub("", name)
 
     return name
 
 def _timestamp():
     return datetime.now()
 
+def _write_csv(df: pd.DataFrame, path: Path, prefer_arrow: bool = False) -> None:
+    """
+    Write df as CSV.
+
+    With prefer_arrow, the multithreaded pyarrow CSV writer is used when
+    pyarrow is installed and every column maps to an Arrow type. Otherwise
+    pandas writes df in chunks, so the whole CSV text is never held in memory.
+    """
+    if prefer_arrow and _write_csv_arrow(df, path):
+        return
+
+    with open(path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as fh:
+        df.to_csv(fh, index=False, chunksize=CSV_CHUNKSIZE)
+
+def _write_excel(df: pd.DataFrame, path: Path, sheet_name: str) -> None:
+    """
+    Write df to a single sheet with xlsxwriter in constant_memory mode.
+
+    Each row is flushed to disk once written, so memory stays flat whatever
+    the table size. Rows are written in order through xlsxwriter directly:
+    pandas.to_excel writes column by column, which constant_memory mode
+    does not support. Column widths or formats must be set before the data.
+    Strings are never turned into hyperlinks, which skips a URL check on
+    every string cell.
+    """
+    import xlsxwriter
+
+    # Missing values (None, NaN, pd.NA) are written as empty cells
+    df = df.astype(object).where(df.notna(), None)
+
+    options = {"constant_memory": True, "strings_to_urls": False}
+
+    with xlsxwriter.Workbook(str(path), options) as workbook:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, list(df.columns))
+
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
+
+def _write_csv_arrow(df: pd.DataFrame, path: Path) -> bool:
+    """Write df with pyarrow.csv, return False if pyarrow cannot handle it."""
+    try:
+        import pyarrow as pa # Optional dependency
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return False
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError): # Mixed-type object columns
+        return False
+
+    try:
+        pa_csv.write_csv(
+            table,
+            str(path),
+            write_options=pa_csv.WriteOptions(batch_size=65_536, quoting_style="needed"),
+        )
+    except pa.ArrowException: # e.g. dictionary columns on older pyarrow, the pandas writer overwrites the partial file
+        return False
+
+    return True
+
 
 
 def build_matching_result_table(
@@ -40,93 +120,114 @@ def build_matching_result_table(
     Strict and wildcard matches never appear on the same row.
     """
 
-    # --- Build mapping target_id -> accession ---
-    df_target = target_db.to_dataframe()
-    target_id_to_acc = dict(zip(df_target["id"], df_target["accession"]))
+    import pandas as pd  # lazy import
 
-    # --- Base query table (all queries, no match by default) ---
+    # --- Positional lookups (no merge) ---
     df_query = query_db.to_dataframe()
-
-    base = df_query.copy()
-    base["strict_matching_target_accession"] = None
-    base["strict_matching_position"] = None
-    base["wildcard_matching_target_accession"] = None
-    base["wildcard_matching_position"] = None
-    base["matching_type"] = "no_match"
+    # Reuse the id column array rather than converting query_db.ids again.
+    # Internal ids are not part of the public output, pop them before any concat.
+    query_index = pd.Index(df_query.pop("id").to_numpy(), copy=False)
+    target_index = pd.Index(target_db.ids)
+    target_accessions = np.asarray(target_db.accessions, dtype=object)
 
     # --- STRICT MATCHES ---
-    df_strict = result_strict.to_dataframe().rename(columns={
-        "query_id": "id",
-        "target_id": "strict_matching_target_id",
-        "position": "strict_matching_position"
-    })
-
-    # Merge with query metadata
-    df_strict = df_query.merge(df_strict, on="id", how="inner")
-
-    # Map internal target_id -> accession
-    df_strict["strict_matching_target_accession"] = (
-        df_strict["strict_matching_target_id"]
-        .map(target_id_to_acc)
-    )
-
-    # Add empty wildcard columns
-    df_strict["wildcard_matching_target_accession"] = None
-    df_strict["wildcard_matching_position"] = None
-    df_strict["matching_type"] = "strict"
+    df_strict = _matching_rows(df_query, query_index, target_index, target_accessions, result_strict, "strict")
 
     # --- WILDCARD MATCHES ---
     df_wildcard = None
     if result_wildcard is not None:
+        df_wildcard = _matching_rows(df_query, query_index, target_index, target_accessions, result_wildcard, "wildcard")
 
-        df_wildcard = result_wildcard.to_dataframe().rename(columns={
-            "query_id": "id",
-            "target_id": "wildcard_matching_target_id",
-            "position": "wildcard_matching_position"
-        })
+    # --- NO MATCH QUERIES ---
+    # Match rows carry their df_query position as index, flag them by position
+    matched = np.zeros(len(df_query), dtype=bool)
+    matched[df_strict.index.to_numpy()] = True
 
-        # Merge with query metadata
-        df_wildcard = df_query.merge(df_wildcard, on="id", how="inner")
+    if df_wildcard is not None:
+        matched[df_wildcard.index.to_numpy()] = True
 
-        # Map internal target_id -> accession
-        df_wildcard["wildcard_matching_target_accession"] = (
-            df_wildcard["wildcard_matching_target_id"]
-            .map(target_id_to_acc)
-        )
+    df_nomatch = df_query.loc[~matched]
+    df_nomatch = pd.concat([df_nomatch, pd.DataFrame({
+        "strict_matching_target_accession": None,
+        "strict_matching_position": None,
+        "wildcard_matching_target_accession": None,
+        "wildcard_matching_position": None,
+        "matching_type": "no_match",
+    }, index=df_nomatch.index)], axis=1)
 
-        # Add empty strict columns
-        df_wildcard["strict_matching_target_accession"] = None
-        df_wildcard["strict_matching_position"] = None
-        df_wildcard["matching_type"] = "wildcard"
+    # --- FINAL UNION ---
+    # Empty frames are left out, df_nomatch is kept if all are empty (no queries)
+    frames = [
+        frame for frame in (df_nomatch, df_strict, df_wildcard)
+        if frame is not None and not frame.empty
+    ] or [df_nomatch]
+
+    # Low cardinality columns as categoricals, with the same categories in
+    # every frame so the concat keeps the categorical dtype. Positions are
+    # nullable integers rather than object columns holding None.
+    accession_dtype = pd.CategoricalDtype(pd.unique(target_accessions))
+    column_dtypes = {
+        "strict_matching_target_accession": accession_dtype,
+        "strict_matching_position": "Int64",
+        "wildcard_matching_target_accession": accession_dtype,
+        "wildcard_matching_position": "Int64",
+        "matching_type": pd.CategoricalDtype(MATCHING_TYPES),
+    }
+    frames = [frame.astype(column_dtypes) for frame in frames]
+
+    # Every frame keeps the df_query row positions as index. Query ids are
+    # generated in that order, so a stable sort on the integer index gives
+    # the id order without comparing id strings. Each frame is already in
+    # query order, so the stable argsort (timsort) only merges sorted runs.
+    if len(frames) == 1: # Single frame, already ordered
+        df_result = frames[0].reset_index(drop=True)
+    else:
+        df_result = pd.concat(frames)
+        order = np.argsort(df_result.index.to_numpy(), kind="stable")
+        df_result = df_result.take(order).reset_index(drop=True)
 
-    # --- NO MATCH QUERIES ---
-    matched_ids = set(df_strict["id"].unique())
+    return df_result
 
-    if df_wildcard is not None:
-        matched_ids.update(df_wildcard["id"].unique())
 
-    df_nomatch = base[~base["id"].isin(matched_ids)]
 
-    # --- FINAL UNION ---
-    frames = [df_nomatch, df_strict]
-    if df_wildcard is not None:
-        frames.append(df_wildcard)
+def _matching_rows(
+        df_query: pd.DataFrame,
+        query_index: pd.Index,
+        target_index: pd.Index,
+        target_accessions: np.ndarray,
+        result: MatchResult,
+        kind: Literal["strict", "wildcard"],
+        ) -> pd.DataFrame:
+    """
+    One row per match of `result`: query metadata taken by position from
+    df_query, target accession taken by position from target_accessions.
+    """
+    import pandas as pd  # lazy import
 
-    df_result = (
-        pd.concat(frames, ignore_index=True)
-          .sort_values("id")
-          .reset_index(drop=True)
-    )
+    query_ids, target_ids, positions = result.arrays()
+    query_positions = query_index.get_indexer(query_ids)
 
-    # --- DROP INTERNAL IDS (clean public output) ---
-    df_result = df_result.drop(columns=[
-        "id",
-        "strict_matching_target_id",
-        "wildcard_matching_target_id",
-    ], errors="ignore")
+    # Put matches in query order (stable, so match order is kept within a query)
+    if (np.diff(query_positions) < 0).any():
+        order = np.argsort(query_positions, kind="stable")
+        query_positions, target_ids, positions = query_positions[order], target_ids[order], positions[order]
 
-    return df_result
+    # Keep the df_query index, used to order the final table
+    rows = df_query.take(query_positions)
+
+    # Match columns in output order, the other matching type stays empty
+    match_columns = {
+        "strict_matching_target_accession": None,
+        "strict_matching_position": None,
+        "wildcard_matching_target_accession": None,
+        "wildcard_matching_position": None,
+        "matching_type": kind,
+    }
+    match_columns[f"{kind}_matching_target_accession"] = target_accessions[target_index.get_indexer(target_ids)]
+    match_columns[f"{kind}_matching_position"] = positions
 
+    # Attach all match columns in one aligned concat instead of five inserts
+    return pd.concat([rows, pd.DataFrame(match_columns, index=rows.index)], axis=1)
 
 
 def compute_rescued_queries(
@@ -136,10 +237,26 @@ def compute_rescued_queries(
     """
     Queries that have no strict match but at least one wildcard match.
     """
-    strict_queries = set(strict.by_query().keys())
-    wildcard_queries = set(wildcard.by_query().keys())
+    # Both groupings are cached on the MatchResult, diff their keys views
+    return wildcard.by_query().keys() - strict.by_query().keys()
 
-    return wildcard_queries - strict_queries
+
+def _group_sizes(groups: dict) -> np.ndarray:
+    """
+    Number of matches in each group of a by_query()/by_target() mapping.
+    """
+    return np.fromiter(map(len, groups.values()), dtype=np.int64, count=len(groups))
+
+
+def _merged_group_sizes(keys: set[str], strict_groups: dict, wildcard_groups: dict) -> np.ndarray:
+    """
+    Number of strict + wildcard matches for each key, in one pass over keys.
+    """
+    return np.fromiter(
+        (len(strict_groups.get(k, ())) + len(wildcard_groups.get(k, ())) for k in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
 
 
 def compute_matching_statistics(
@@ -154,15 +271,30 @@ def compute_matching_statistics(
     timestamp: datetime,
     analysis_name: str | None = None,
 ) -> pd.DataFrame:
+    import pandas as pd  # lazy import
 
-    rows = []
+    # One list per output column, the DataFrame is built columnwise at the end
+    sources = []
+    metrics = []
+    values = []
 
     def add(source: str, metric: str, value):
-        rows.append({
-            "source": source,
-            "metric": metric,
-            "value": value,
-        })
+        sources.append(source)
+        metrics.append(metric)
+        values.append(value)
+
+    # Wildcard metrics are only reported for a non empty wildcard result
+    has_wildcard = bool(result_wildcard)
+
+    # Groupings and counts used by several metrics, computed once
+    strict_by_query = result_strict.by_query()
+    strict_by_target = result_strict.by_target()
+    wildcard_by_query = result_wildcard.by_query() if has_wildcard else {}
+    wildcard_by_target = result_wildcard.by_target() if has_wildcard else {}
+    n_queries = query_db.size
+    n_unique_queries = query_db.n_unique_accessions()
+    n_strict_queries = result_strict.n_unique_queries()
+    n_wildcard_queries = result_wildcard.n_unique_queries() if has_wildcard else 0
 
     # =====================
     # GLOBAL METADATA
@@ -179,8 +311,8 @@ def compute_matching_statistics(
     # QUERY DB
     # =====================
 
-    add("query_db", "n_queries", query_db.size)
-    add("query_db", "n_unique_queries", query_db.n_unique_accessions())
+    add("query_db", "n_queries", n_queries)
+    add("query_db", "n_unique_queries", n_unique_queries)
 
     # =====================
     # TARGET DB
@@ -195,93 +327,91 @@ def compute_matching_statistics(
     # MATCHING SUMMARY (global)
     # =====================
 
-    n_total_matches = result_strict.__len__()
-    if result_wildcard:
-        n_total_matches += result_wildcard.__len__()
+    n_strict_matches = len(result_strict)
+    n_wildcard_matches = len(result_wildcard) if has_wildcard else 0
 
-    add("matching_summary", "n_total_matches", n_total_matches)
-    add("matching_summary", "n_strict_matches", result_strict.__len__())
+    add("matching_summary", "n_total_matches", n_strict_matches + n_wildcard_matches)
+    add("matching_summary", "n_strict_matches", n_strict_matches)
     if allow_wildcard:
-        add("matching_summary", "n_wildcard_matches", result_wildcard.__len__() if result_wildcard else 0)
+        add("matching_summary", "n_wildcard_matches", n_wildcard_matches)
 
     # Unique queries with any match
-    strict_queries = set(result_strict.by_query().keys())
-    wildcard_queries = set(result_wildcard.by_query().keys()) if result_wildcard else set()
-    all_matched_queries = strict_queries | wildcard_queries
+    if has_wildcard:
+        all_matched_queries = strict_by_query.keys() | wildcard_by_query.keys()
+    else:
+        all_matched_queries = strict_by_query.keys()
 
     add("matching_summary", "n_unique_queries_with_match", len(all_matched_queries))
     add(
         "matching_summary",
         "fraction_unique_queries_with_match",
-        len(all_matched_queries) / query_db.n_unique_accessions() if query_db.n_unique_accessions() else 0.0,
+        len(all_matched_queries) / n_unique_queries if n_unique_queries else 0.0,
     )
 
     # Per-query match distribution (merge strict + wildcard counts)
-    merged_counts = []
-
-    for qid in all_matched_queries:
-        n = result_strict.n_matches_for_query(qid)
-        if result_wildcard:
-            n += result_wildcard.n_matches_for_query(qid)
-        merged_counts.append(n)
+    strict_counts = _group_sizes(strict_by_query)
+    if has_wildcard:
+        merged_counts = _merged_group_sizes(all_matched_queries, strict_by_query, wildcard_by_query)
+    else:
+        merged_counts = strict_counts
 
-    add("matching_summary", "mean_matches_per_unique_query", sum(merged_counts) / len(merged_counts) if merged_counts else 0.0)
-    add("matching_summary", "max_matches_per_unique_query", max(merged_counts) if merged_counts else 0)
+    add("matching_summary", "mean_matches_per_unique_query", float(merged_counts.mean()) if merged_counts.size else 0.0)
+    add("matching_summary", "max_matches_per_unique_query", int(merged_counts.max()) if merged_counts.size else 0)
 
     # Targets hit
-    strict_targets = set(result_strict.by_target().keys())
-    wildcard_targets = set(result_wildcard.by_target().keys()) if result_wildcard else set()
-    all_targets_hit = strict_targets | wildcard_targets
+    if has_wildcard:
+        all_targets_hit = strict_by_target.keys() | wildcard_by_target.keys()
+    else:
+        all_targets_hit = strict_by_target.keys()
 
     add("matching_summary", "n_targets_hit", len(all_targets_hit))
 
     # Queries per target
-    merged_target_counts = []
-
-    for tid in all_targets_hit:
-        n = len(result_strict.matches_for_target(tid))
-        if result_wildcard:
-            n += len(result_wildcard.matches_for_target(tid))
-        merged_target_counts.append(n)
+    if has_wildcard:
+        merged_target_counts = _merged_group_sizes(all_targets_hit, strict_by_target, wildcard_by_target)
+    else:
+        merged_target_counts = _group_sizes(strict_by_target)
 
     add(
         "matching_summary",
         "mean_queries_per_target_with_match",
-        sum(merged_target_counts) / len(merged_target_counts) if merged_target_counts else 0.0,
+        float(merged_target_counts.mean()) if merged_target_counts.size else 0.0,
     )
     add(
         "matching_summary",
         "max_queries_per_target_with_match",
-        max(merged_target_counts) if merged_target_counts else 0,
+        int(merged_target_counts.max()) if merged_target_counts.size else 0,
     )
 
     # =====================
     # STRICT MATCHING
     # =====================
 
-    add("strict_matching", "n_unique_queries_with_strict_match", len(result_strict.by_query()))
+    add("strict_matching", "n_unique_queries_with_strict_match", n_strict_queries)
     add(
         "strict_matching",
         "fraction_unique_queries_with_strict_match",
-        len(result_strict.by_query()) / query_db.n_unique_accessions() if query_db.n_unique_accessions() else 0.0,
+        n_strict_queries / n_unique_queries if n_unique_queries else 0.0,
     )
-    add("strict_matching", "mean_strict_matches_per_unique_query", result_strict.mean_matches_per_unique_query())
-    add("strict_matching", "max_strict_matches_per_unique_query", result_strict.max_matches_per_unique_query())
+    add("strict_matching", "mean_strict_matches_per_unique_query", float(strict_counts.mean()) if strict_counts.size else 0.0)
+    add("strict_matching", "max_strict_matches_per_unique_query", int(strict_counts.max()) if strict_counts.size else 0)
 
     # =====================
     # WILDCARD MATCHING
     # =====================
 
-    if result_wildcard:
+    if has_wildcard:
 
-        add("wildcard_matching", "n_unique_queries_with_wildcard_match", len(result_wildcard.by_query()))
+        add("wildcard_matching", "n_unique_queries_with_wildcard_match", n_wildcard_queries)
         add(
             "wildcard_matching",
             "fraction_unique_queries_with_wildcard_match",
-            len(result_wildcard.by_query()) / query_db.n_unique_accessions() if query_db.n_unique_accessions() else 0.0,
+            n_wildcard_queries / n_unique_queries if n_unique_queries else 0.0,
         )
-        add("wildcard_matching", "mean_wildcard_matches_per_unique_query", result_wildcard.mean_matches_per_unique_query())
-        add("wildcard_matching", "max_wildcard_matches_per_unique_query", result_wildcard.max_matches_per_unique_query())
+        wildcard_counts = _group_sizes(wildcard_by_query)
+
+        add("wildcard_matching", "mean_wildcard_matches_per_unique_query", float(wildcard_counts.mean()) if wildcard_counts.size else 0.0)
+        add("wildcard_matching", "max_wildcard_matches_per_unique_query", int(wildcard_counts.max()) if wildcard_counts.size else 0)
 
         # Rescued queries
         rescued = compute_rescued_queries(result_strict, result_wildcard)
@@ -290,15 +420,20 @@ def compute_matching_statistics(
         add(
             "wildcard_matching",
             "fraction_queries_rescued_by_wildcard",
-            len(rescued) / query_db.size if query_db.size else 0.0,
+            len(rescued) / n_queries if n_queries else 0.0,
         )
         add(
             "wildcard_matching",
             "fraction_unique_queries_rescued_by_wildcard",
-            len(rescued) / query_db.n_unique_accessions() if query_db.n_unique_accessions() else 0.0,
+            len(rescued) / n_unique_queries if n_unique_queries else 0.0,
         )
 
-    return pd.DataFrame(rows)
+    # All columns are object, declared up front to skip dtype inference
+    return pd.DataFrame({
+        "source": sources,
+        "metric": metrics,
+        "value": values,
+    }, dtype=object, copy=False)
 
 
 
@@ -315,16 +450,18 @@ def write_outputs(
     allow_wildcard: bool,
     wildcards: set | None,
     analysis_name: str | None = None,
+    timestamp: datetime | None = None,
 ):
     
     # Generate name
     output_path = Path(output_path)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    if analysis_name:
-        analysis = _sanitize_name(analysis_name)
+    # Filename suffix, always bound even without analysis name
+    suffix = f"_{_sanitize_name(analysis_name)}" if analysis_name else ""
 
-    ts = _timestamp() # Get a common timestamp for both output files
+    ts = timestamp or _timestamp() # Get a common timestamp for both output files
+    stamp = ts.strftime("%Y%m%d_%H%M%S")
 
     ext = "csv" if output_format == "csv" else "xlsx"
 
@@ -333,43 +470,59 @@ def write_outputs(
     
     result_file = Path(
         output_path,
-        f"microtpct_matching_result{'_' + analysis if analysis_name else ''}_{ts.strftime('%Y%m%d_%H%M%S')}.{ext}"
+        f"microtpct_matching_result{suffix}_{stamp}.{ext}"
         )
 
     stats_file = Path(
         output_path,
-        f"microtpct_statistics{'_' + analysis if analysis_name else ''}_{ts.strftime('%Y%m%d_%H%M%S')}.{ext}"
+        f"microtpct_statistics{suffix}_{stamp}.{ext}"
         )
 
 
-    # Build matching result into pd.Dataframe
-    df_result = build_matching_result_table(query_db, target_db, result_strict, result_wildcard)
-
-    # Computes statistics into pd.Dataframe
-    df_stats = compute_matching_statistics(
-        query_db,
-        target_db,
-        result_strict,
-        result_wildcard,
-        n_target_with_wildcards,
-        matching_engine,
-        allow_wildcard,
-        wildcards,
-        ts,
-        analysis_name,
-    )
+    # Result table and statistics only read the inputs, build them concurrently,
+    # then write both independent files concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        # Build matching result into pd.Dataframe
+        result_future = executor.submit(
+            build_matching_result_table, query_db, target_db, result_strict, result_wildcard
+        )
+
+        # Computes statistics into pd.Dataframe
+        stats_future = executor.submit(
+            compute_matching_statistics,
+            query_db,
+            target_db,
+            result_strict,
+            result_wildcard,
+            n_target_with_wildcards,
+            matching_engine,
+            allow_wildcard,
+            wildcards,
+            ts,
+            analysis_name,
+        )
+
+        df_result = result_future.result()
+        df_stats = stats_future.result()
+
+        if output_format == "csv":
+            futures = [
+                executor.submit(_write_csv, df_result, result_file, prefer_arrow=True),
+                executor.submit(_write_csv, df_stats, stats_file),
+            ]
 
+        elif output_format == "excel":
+            futures = [
+                executor.submit(_write_excel, df_result, result_file, sheet_name="results"),
+                executor.submit(_write_excel, df_stats, stats_file, sheet_name="statistics"),
+            ]
 
-    if output_format == "csv":
-        df_result.to_csv(result_file, index=False)
-        df_stats.to_csv(stats_file, index=False)
+        else:
+            futures = []
 
-    elif output_format == "excel":
-        with pd.ExcelWriter(result_file, engine="xlsxwriter") as writer:
-            df_result.to_excel(writer, index=False, sheet_name="results")
-        
-        with pd.ExcelWriter(stats_file, engine="xlsxwriter") as writer:
-            df_stats.to_excel(writer, index=False, sheet_name="statistics")
+        for future in futures:
+            future.result() # Re-raise any write error
 
     return result_file, stats_file
 
@@ -1,9 +1,11 @@
 import random
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
 import json
+from itertools import chain
 from pathlib import Path
-import pandas as pd
+import numpy as np
 
 from microtpct.io.schema import TargetInput, QueryInput
 from microtpct.io.converters import build_database
@@ -12,31 +14,43 @@ from microtpct.io.readers import SequenceRole
 
 # Alphabet utilities
 AA_ALPHABET = "GPAVLIMCFYWHKRQNEDST"  # standard without X
+AA_BYTES = np.frombuffer(AA_ALPHABET.encode("ascii"), dtype=np.uint8)
 
+# k-mer prefilter for non matching peptides: 5 bits per residue, X and
+# separators share code 31 so their k-mers never equal a peptide k-mer
+KMER_SIZE = 8
+NOMATCH_BATCH_SIZE = 64 # Candidates drawn per batch
+_RESIDUE_CODES = np.full(256, 31, dtype=np.int64)
+_RESIDUE_CODES[AA_BYTES] = np.arange(len(AA_ALPHABET))
 
-def random_sequence(length: int, rng: random.Random) -> str:
-    return "".join(rng.choices(AA_ALPHABET, k=length))
 
-
-def inject_X(sequence: str, x_rate: float, rng: random.Random) -> str:
+def replace_X(sequence: str, rng: random.Random) -> str:
     """
-    Randomly replace amino acids by X with probability x_rate.
+    Replace all X by random amino acids (used for peptides).
     """
-    seq = list(sequence)
-    for i in range(len(seq)):
-        if rng.random() < x_rate:
-            seq[i] = "X"
-    return "".join(seq)
+    if "X" not in sequence: # Most peptides, no per residue work
+        return sequence
 
+    # Draw every replacement at once and splice them between the X-free parts
+    parts = sequence.split("X")
+    fills = rng.choices(AA_ALPHABET, k=len(parts) - 1)
 
-def replace_X(sequence: str, rng: random.Random) -> str:
+    return "".join(chain.from_iterable(zip(parts, fills))) + parts[-1]
+
+
+def _kmer_codes(sequence: str, k: int) -> np.ndarray:
     """
-    Replace all X by random amino acids (used for peptides).
+    Integer code of every k-mer of sequence, in order.
     """
-    return "".join(
-        rng.choice(AA_ALPHABET) if aa == "X" else aa
-        for aa in sequence
-    )
+    values = _RESIDUE_CODES[np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)]
+    n = values.size - k + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    codes = np.zeros(n, dtype=np.int64)
+    for j in range(k):
+        codes = (codes << 5) | values[j:j + n]
+    return codes
 
 
 # Proteome generation
@@ -49,22 +63,26 @@ def generate_proteome(
     seed: Optional[int] = None,
 ) -> List[TargetInput]:
 
-    rng = random.Random(seed)
-    proteins: List[TargetInput] = []
+    gen = np.random.default_rng(seed)
 
-    for i in range(n_proteins):
-        length = max(1, int(rng.gauss(mean_length, std_length)))
-        seq = random_sequence(length, rng)
-        seq = inject_X(seq, x_rate, rng)
+    # Draw all lengths and residues at once, as one flat buffer of residue bytes
+    lengths = np.maximum(1, gen.normal(mean_length, std_length, n_proteins).astype(np.int64))
+    total = int(lengths.sum())
 
-        proteins.append(
-            TargetInput(
-                accession=f"P{i+1:06d}",
-                sequence=seq,
-            )
-        )
+    residues = AA_BYTES[gen.integers(0, len(AA_ALPHABET), total)]
+    residues[gen.random(total) < x_rate] = ord("X") # X injection, in place
+
+    # Decode once, then cut one sequence per protein
+    flat = residues.tobytes().decode("ascii")
+    offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
 
-    return proteins
+    return [
+        TargetInput(
+            accession=f"P{i+1:06d}",
+            sequence=flat[offsets[i]:offsets[i+1]],
+        )
+        for i in range(n_proteins)
+    ]
 
 
 def introduce_redundancy(
@@ -87,6 +105,10 @@ def introduce_redundancy(
     duplicate_indices = rng.sample(range(n), k)
     new_proteins = list(proteins)
 
+    # numpy stream seeded from rng, so seeded runs stay reproducible
+    gen = np.random.default_rng(rng.getrandbits(64))
+    x_byte = ord("X")
+
     dup_counter: dict[str, int] = {}
 
     for idx in duplicate_indices:
@@ -100,13 +122,15 @@ def introduce_redundancy(
         dup_counter[parent_acc] = dup_counter.get(parent_acc, 0) + 1
         dup_version = dup_counter[parent_acc]
 
-        seq = list(parent.sequence)
-
-        for j in range(len(seq)):
-            if seq[j] != "X" and rng.random() < mutation_rate:
-                seq[j] = rng.choice(AA_ALPHABET)
+        # Each non X residue mutates with probability mutation_rate: draw the
+        # number of mutations, then their sites, instead of one draw per residue
+        seq = np.frombuffer(parent.sequence.encode("ascii"), dtype=np.uint8).copy()
+        candidates = np.flatnonzero(seq != x_byte)
+        n_mutations = gen.binomial(candidates.size, mutation_rate)
+        sites = gen.choice(candidates, n_mutations, replace=False)
+        seq[sites] = AA_BYTES[gen.integers(0, len(AA_ALPHABET), n_mutations)]
 
-        new_seq = "".join(seq)
+        new_seq = seq.tobytes().decode("ascii")
         new_acc = f"{parent_acc}_DUP_{dup_version}"
 
         new_proteins[idx] = TargetInput(
@@ -119,6 +143,35 @@ def introduce_redundancy(
 
 # Query generation (match only, no ground truth)
 
+def sample_subsequences(
+    proteins: List[TargetInput],
+    n_peptides: int,
+    mean_length: float,
+    std_length: float,
+    rng: random.Random,
+) -> List[str]:
+    """
+    Random protein windows for n_peptides peptides.
+
+    Protein choice, length (capped at the protein length) and start are
+    drawn for all peptides at once with numpy, seeded from rng.
+    """
+    gen = np.random.default_rng(rng.getrandbits(64))
+
+    prot_lengths = np.fromiter((len(p.sequence) for p in proteins), dtype=np.int64, count=len(proteins))
+    prot_idx = gen.integers(0, len(proteins), n_peptides)
+    prot_lengths = prot_lengths[prot_idx]
+
+    pep_lengths = np.maximum(1, gen.normal(mean_length, std_length, n_peptides).astype(np.int64))
+    pep_lengths = np.minimum(pep_lengths, prot_lengths)
+    starts = gen.integers(0, prot_lengths - pep_lengths + 1)
+
+    return [
+        proteins[i].sequence[start:start + length]
+        for i, start, length in zip(prot_idx.tolist(), starts.tolist(), pep_lengths.tolist())
+    ]
+
+
 def extract_matching_peptides(
     proteins: List[TargetInput],
     n_peptides: int,
@@ -129,16 +182,9 @@ def extract_matching_peptides(
 
     peptides: List[QueryInput] = []
 
-    for i in range(n_peptides):
-        prot = rng.choice(proteins)
-        prot_seq = prot.sequence
-
-        pep_len = max(1, int(rng.gauss(mean_length, std_length)))
-        pep_len = min(pep_len, len(prot_seq))
-
-        start = rng.randint(0, len(prot_seq) - pep_len)
-        pep_seq = prot_seq[start:start + pep_len]
+    windows = sample_subsequences(proteins, n_peptides, mean_length, std_length, rng)
 
+    for i, pep_seq in enumerate(windows):
         pep_seq = replace_X(pep_seq, rng)
 
         peptide = QueryInput(
@@ -153,9 +199,13 @@ def extract_matching_peptides(
 
 # Query generation (quasi-match)
 
+# Substitution choices for each residue, the residue itself excluded
+_SUBSTITUTIONS = {aa: AA_ALPHABET.replace(aa, "") for aa in AA_ALPHABET + "X"}
+
+
 def mutate_peptide_once(peptide: str, rng: random.Random) -> str:
     pos = rng.randrange(len(peptide))
-    new_aa = rng.choice([aa for aa in AA_ALPHABET if aa != peptide[pos]])
+    new_aa = rng.choice(_SUBSTITUTIONS[peptide[pos]])
     return peptide[:pos] + new_aa + peptide[pos+1:]
 
 
@@ -169,16 +219,9 @@ def generate_quasi_matching_peptides(
 
     peptides: List[QueryInput] = []
 
-    for i in range(n_peptides):
-        prot = rng.choice(proteins)
-        seq = prot.sequence
-
-        pep_len = max(1, int(rng.gauss(mean_length, std_length)))
-        pep_len = min(pep_len, len(seq))
-
-        start = rng.randint(0, len(seq) - pep_len)
-        pep = seq[start:start + pep_len]
+    windows = sample_subsequences(proteins, n_peptides, mean_length, std_length, rng)
 
+    for i, pep in enumerate(windows):
         pep = replace_X(pep, rng)
         pep = mutate_peptide_once(pep, rng)
 
@@ -205,12 +248,51 @@ def generate_non_matching_peptides(
 
     peptides: List[QueryInput] = []
 
+    # One string for the whole proteome, a single substring search per candidate.
+    # The separator is not an amino acid, so no hit spans two proteins.
+    proteome = "\n".join(proteome_sequences)
+
+    # Sorted codes of all proteome k-mers (duplicates are harmless). A candidate
+    # whose first k-mer is absent cannot occur in the proteome, only the others
+    # need the full search.
+    proteome_kmers = np.sort(_kmer_codes(proteome, KMER_SIZE))
+
+    gen = np.random.default_rng(rng.getrandbits(64))
+
+    def candidates():
+        """
+        Endless (peptide, absent) stream. Candidates are drawn and k-mer
+        filtered in batches, absent is True when the k-mer filter already
+        proves the peptide is not in the proteome.
+        """
+        while True:
+            lengths = np.maximum(1, gen.normal(mean_length, std_length, NOMATCH_BATCH_SIZE).astype(np.int64))
+            residues = gen.integers(0, len(AA_ALPHABET), int(lengths.sum()))
+            offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+            # First k-mer code of each long enough candidate, looked up at once
+            codes = np.zeros(NOMATCH_BATCH_SIZE, dtype=np.int64)
+            long_enough = lengths >= KMER_SIZE
+            for j in range(KMER_SIZE):
+                codes = (codes << 5) | residues[np.minimum(offsets[:-1] + j, residues.size - 1)]
+            if proteome_kmers.size == 0:
+                absent = long_enough # Proteome shorter than k everywhere, no k-mer to find
+            else:
+                idx = np.minimum(np.searchsorted(proteome_kmers, codes), proteome_kmers.size - 1)
+                absent = long_enough & (proteome_kmers[idx] != codes)
+
+            flat = AA_BYTES[residues].tobytes().decode("ascii")
+            bounds = offsets.tolist()
+            for j in range(NOMATCH_BATCH_SIZE):
+                yield flat[bounds[j]:bounds[j+1]], bool(absent[j])
+
+    stream = candidates()
+
     for i in range(n_peptides):
         for _ in range(max_trials):
-            pep_len = max(1, int(rng.gauss(mean_length, std_length)))
-            pep = random_sequence(pep_len, rng)
+            pep, absent = next(stream)
 
-            if not any(pep in prot for prot in proteome_sequences):
+            if absent or pep not in proteome:
                 peptides.append(
                     QueryInput(
                         accession=f"PEP_RANDOM_{i+1:06d}",
@@ -226,6 +308,7 @@ def generate_non_matching_peptides(
 
 # Parameter validation and config utilities
 
+@lru_cache(maxsize=128) # Parameter sweeps validate the same configs again, failures are not cached
 def validate_parameters(
     *,
     n_proteins: int,
@@ -377,6 +460,9 @@ def generate_benchmark_databases(
         rng=rng,
     )
 
+    # Final proteome, built once and its sequence list reused below
+    target_db = build_database(proteins, SequenceRole.TARGET)
+
     n_match = int(n_peptides * match_fraction)
     n_quasi = int(n_peptides * quasi_fraction)
     n_nomatch = n_peptides - n_match - n_quasi
@@ -397,10 +483,8 @@ def generate_benchmark_databases(
         rng=rng,
     )
 
-    proteome_sequences = [p.sequence for p in proteins]
-
     nomatch_peptides = generate_non_matching_peptides(
-        proteome_sequences=proteome_sequences,
+        proteome_sequences=target_db.sequences,
         n_peptides=n_nomatch,
         mean_length=peptide_mean_length,
         std_length=peptide_std_length,
@@ -416,7 +500,6 @@ def generate_benchmark_databases(
     if export_query_xlsx_path:
         export_query_xlsx(all_peptides, export_query_xlsx_path)
 
-    target_db = build_database(proteins, SequenceRole.TARGET)
     query_db = build_database(all_peptides, SequenceRole.QUERY)
 
     if save_config_path:
@@ -434,11 +517,12 @@ def export_target_fasta(
 
     path = Path(path)
 
+    # Whole FASTA payload built first, then written in one call
     with open(path, "w") as f:
-        for prot in proteins:
-            header = f">{prefix}|{prot.accession}"
-            f.write(header + "\n")
-            f.write(prot.sequence + "\n")
+        f.write("".join(
+            f">{prefix}|{prot.accession}\n{prot.sequence}\n"
+            for prot in proteins
+        ))
 
 
 def export_query_xlsx(
@@ -446,14 +530,18 @@ def export_query_xlsx(
     path: str | Path,
 ):
 
+    import xlsxwriter
+
     path = Path(path)
 
-    df = pd.DataFrame({
-        "accession": [p.accession for p in peptides],
-        "sequence": [p.sequence for p in peptides],
-    })
+    # Rows streamed to disk (constant_memory), no intermediate DataFrame
+    with xlsxwriter.Workbook(str(path), {"constant_memory": True, "strings_to_urls": False}) as workbook:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, ["accession", "sequence"])
 
-    df.to_excel(path, index=False)
+        for row_idx, pep in enumerate(peptides, start=1):
+            worksheet.write_string(row_idx, 0, pep.accession)
+            worksheet.write_string(row_idx, 1, pep.sequence)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""
+Helpers shared by the test scripts: cached database loading and matching.
+
+Import it as tests._pipeline_util, scripts are run from the repository
+root (python -m tests.minimal_pipeline).
+"""
+from microtpct.io.validators import validate_query_columns, validate_target_columns
+from microtpct.io.readers import read_file_columnar, SequenceRole
+from microtpct.io.converters import build_database_from_columns
+from microtpct.core.results import Match, MatchResult
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import pickle
+import sys
+
+import numpy as np
+
+
+CACHE_DIR = Path.home() / ".cache" / "microtpct"
+
+
+def load_columns(path: str, mtime_ns: int, size: int, role: SequenceRole):
+    """
+    read_file_columnar() with a pickle cache on disk, keyed on the file path,
+    mtime, size and role. Editing the file invalidates it.
+    """
+    key = hashlib.sha1(f"{path}|{mtime_ns}|{size}|{role.value}".encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.pkl"
+
+    if cache_file.exists():
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+
+    cols = read_file_columnar(path, role=role)
+
+    # Don't persist a failed read (errors are only logged by the readers)
+    if cols[1]:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(cols, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return cols
+
+
+def mini_pipeline(path, role: SequenceRole):
+    """
+    Read, validate and build the database of a file. Parsed columns are
+    cached on disk for unchanged files, see load_columns().
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+
+    # Columns straight from the reader (or the cache), no Input object per record
+    cols = load_columns(str(path), stat.st_mtime_ns, stat.st_size, role)
+
+    # Validate, one pass over the whole sequence column
+    if role == SequenceRole.TARGET:
+        validate_target_columns(*cols, normalized=True)
+    else:
+        validate_query_columns(*cols, normalized=True)
+
+    # Build DB
+    db = build_database_from_columns(cols, role=role)
+
+    return db
+
+
+def load_databases(peptide_path, fasta_path):
+    """
+    Run mini_pipeline on the peptide and proteome files in two processes,
+    the two loads are independent. Returns (query_db, target_db).
+    """
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        query_future = executor.submit(mini_pipeline, peptide_path, SequenceRole.QUERY)
+        target_future = executor.submit(mini_pipeline, fasta_path, SequenceRole.TARGET)
+        return query_future.result(), target_future.result()
+
+
+def cached_matching(run, target_db, query_db):
+    """
+    run(target_db, query_db) with its MatchResult saved as .npz under
+    CACHE_DIR, keyed on the engine (name and source, see _engine_digest())
+    and the content of both databases.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{run.__module__}.{run.__name__}".encode())
+    h.update(_engine_digest(run.__module__))
+    for db in (target_db, query_db):
+        h.update(b"\x00" + "\n".join(db.ids).encode())
+        h.update(b"\x00" + "\n".join(db.ambiguous_il_sequences).encode())
+    cache_file = CACHE_DIR / f"matches_{h.hexdigest()}.npz"
+
+    if cache_file.exists():
+        with np.load(cache_file) as data:
+            return MatchResult(
+                Match(q_id, t_id, position)
+                for q_id, t_id, position in zip(
+                    data["query_ids"].tolist(), data["target_ids"].tolist(), data["positions"].tolist()
+                )
+            )
+
+    result = run(target_db, query_db)
+
+    query_ids, target_ids, positions = result.arrays()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Ids saved as unicode arrays, so that loading does not need pickle
+    np.savez(cache_file, query_ids=query_ids.astype(str), target_ids=target_ids.astype(str), positions=positions)
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def _engine_digest(module_name: str) -> bytes:
+    """
+    Digest of the source files of the engine's package (the engine module
+    and its helpers), so that editing an engine invalidates its cached matches.
+    """
+    package_dir = Path(sys.modules[module_name].__file__).parent
+
+    h = hashlib.blake2b(digest_size=16)
+    for source in sorted(package_dir.glob("*.py")):
+        h.update(source.name.encode() + b"\x00" + source.read_bytes())
+    return h.digest()
@@ -1,81 +1,54 @@
-from turtle import pd
-from microtpct.io.validators import validate_peptide_input, validate_protein_input
-from microtpct.io.readers import read_file, SequenceRole
-from microtpct.io.converters import *
+from tests._pipeline_util import load_databases, cached_matching
 from pathlib import Path
+import os
 
+# XLSX peptides are streamed by python-calamine (see requirements.txt), openpyxl read-only is the slow fallback
 peptide_file_path = Path(r"/mnt/c/Users/Hp/Desktop/biocomp_repository/MicroTPCT/peptides_noe.xlsx") #Path(r"C:\Users\huawei\Desktop\Liste_peptides.xlsx")
 proteome_file_path = Path(r"/mnt/c/Users/Hp/Desktop/biocomp_repository/MicroTPCT/uniprotkb_proteome_UP000000803_2025_11_25.fasta") #Path(r"C:\Users\huawei\Downloads\uniprotkb_proteome_UP000000803_2025_11_25.fasta")
 
 
+if __name__ == "__main__":
 
-def mini_pipeline(path, role: SequenceRole):
-    sequences_iterator = read_file(path, role=role)
+    query_db, target_db = load_databases(peptide_file_path, proteome_file_path)
 
-    sequences = list(sequences_iterator)
+    # DataFrame previews only on request (MICROTPCT_VERBOSE=1), the proteome one is large
+    if os.environ.get("MICROTPCT_VERBOSE"):
+        print(query_db.to_dataframe().head(5).to_string(index=False))
 
-    # # Validate
-    # if role == SequenceRole.PROTEIN:
-    #     for obj in sequences:
-    #         validate_protein_input(obj)
-    # else:
-    #     for obj in sequences:
-    #         validate_peptide_input(obj)
+        print(target_db.to_dataframe().head(5).to_string(index=False))
 
-    # Build DB
-    db = build_database(sequences, role=role)
 
-    return db
+    from microtpct.core.match import run_find
 
+    matching_results = cached_matching(run_find, target_db, query_db)
 
+    print(matching_results.matches_for_query("Q001721"))
 
+    print(matching_results.n_unique_targets_for_query("Q001721"))
 
-query_db = mini_pipeline(peptide_file_path, SequenceRole.PEPTIDE)
+    unique_target_counts = matching_results.unique_target_counts()
 
+    print(sorted(qid for qid, n in unique_target_counts.items() if n > 1))
 
-print(query_db.to_dataframe())
-
-
-target_db = mini_pipeline(proteome_file_path, SequenceRole.PROTEIN)
-
-print(target_db.to_dataframe())
-
-
-from microtpct.core.match import run_find
-
-matching_results = run_find(target_db, query_db)
-
-print(matching_results.matches_for_query("Q001721"))
-
-print(matching_results.n_unique_targets_for_query("Q001721"))
-
-print([qid for qid in query_db.ids if matching_results.n_unique_targets_for_query(qid) > 1])
-
-print(matching_results.peptides_with_no_match(query_db.ids))
+    print(matching_results.peptides_with_no_match(query_db.ids))
 
 
 
 # FOR GUI TESTING PURPOSES ONLY
 # tests/minimal_pipeline.py
-from microtpct.io.readers import read_file, SequenceRole
-from microtpct.io.converters import build_database
 from microtpct.core.match import run_find
 from pathlib import Path
+import pandas as pd
 
 def minimal_pipeline_gui(fasta_path, peptide_path, output_path=None, algorithm="match_find", wildcard=None, config=None):
     """
     Runs a minimal pipeline with FASTA and peptide inputs.
     """
-    # Load sequences
-    query_sequences = list(read_file(peptide_path, role=SequenceRole.PEPTIDE))
-    target_sequences = list(read_file(fasta_path, role=SequenceRole.PROTEIN))
-
-    # Build databases
-    query_db = build_database(query_sequences, role=SequenceRole.PEPTIDE)
-    target_db = build_database(target_sequences, role=SequenceRole.PROTEIN)
+    # Load sequences and build databases, peptides and proteome in parallel
+    query_db, target_db = load_databases(peptide_path, fasta_path)
 
     # Run matching (simplified)
-    matching_results = run_find(target_db, query_db)
+    matching_results = cached_matching(run_find, target_db, query_db)
 
     # Optionally save output
     if output_path:
@@ -0,0 +1,70 @@
+import random
+
+import numpy as np
+import pytest
+
+from microtpct.utils.data_generator import (
+    KMER_SIZE,
+    _kmer_codes,
+    generate_non_matching_peptides,
+)
+
+
+# ----------------------------------------------------------------------
+# K-MER CODES
+# ----------------------------------------------------------------------
+def test_kmer_codes_shorter_than_k():
+    assert _kmer_codes("ACD", KMER_SIZE).size == 0
+    assert _kmer_codes("", KMER_SIZE).size == 0
+
+
+def test_kmer_codes_equal_kmers_have_equal_codes():
+    codes = _kmer_codes("ACDEFGHIK" + "ACDEFGHIK", KMER_SIZE)
+    assert codes.size == 18 - KMER_SIZE + 1
+    assert codes[0] == codes[9] # Same k-mer "ACDEFGHI" at positions 0 and 9
+    assert codes[0] != codes[1]
+
+
+def test_kmer_codes_separator_never_matches_residues():
+    # k-mers spanning the "\n" protein separator must not equal any peptide k-mer
+    spanning = _kmer_codes("ACDE\nFGHI", KMER_SIZE)
+    residues = _kmer_codes("ACDEFGHI", KMER_SIZE)
+    assert not np.isin(spanning, residues).any()
+
+
+# ----------------------------------------------------------------------
+# NON MATCHING PEPTIDES
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("proteome", [[], [""], ["ACD"], ["ACD", "KLM"]])
+def test_non_matching_proteome_without_kmers(proteome):
+    peptides = generate_non_matching_peptides(proteome, 20, 10, 2, random.Random(0))
+    assert len(peptides) == 20
+    joined = "\n".join(proteome)
+    assert all(pep.sequence not in joined for pep in peptides)
+
+
+def test_non_matching_short_peptides():
+    # Peptides shorter than k skip the prefilter and go through the full search
+    proteome = ["GPAVLIMCFYWHKRQNEDST" * 3]
+    peptides = generate_non_matching_peptides(proteome, 50, 4, 1, random.Random(1))
+    assert len(peptides) == 50
+    assert all(pep.sequence not in proteome[0] for pep in peptides)
+
+
+def test_non_matching_never_in_proteome():
+    rng = random.Random(2)
+    proteome = ["".join(rng.choices("ACDEFGHIKLMNPQRSTVWY", k=200)) for _ in range(50)]
+    joined = "\n".join(proteome)
+
+    peptides = generate_non_matching_peptides(proteome, 200, 10, 3, random.Random(3))
+
+    assert len(peptides) == 200
+    assert all(pep.sequence not in joined for pep in peptides)
+    assert [pep.accession for pep in peptides[:2]] == ["PEP_RANDOM_000001", "PEP_RANDOM_000002"]
+
+
+def test_non_matching_is_reproducible():
+    proteome = ["ACDEFGHIKLMNPQRSTVWY" * 5]
+    first = generate_non_matching_peptides(proteome, 10, 10, 2, random.Random(4))
+    second = generate_non_matching_peptides(proteome, 10, 10, 2, random.Random(4))
+    assert [p.sequence for p in first] == [p.sequence for p in second]
@@ -0,0 +1,205 @@
+from pathlib import Path
+
+import pytest
+
+from microtpct.io.readers import (
+    FastaReader,
+    SequenceRole,
+    _read_fasta_mmap,
+    read_file,
+    read_file_columnar,
+)
+from microtpct.io.validators import validate_query_columns
+
+
+# ----------------------------------------------------------------------
+# HELPERS
+# ----------------------------------------------------------------------
+def write_fasta(tmp_path: Path, text: str, name: str = "input.fasta") -> Path:
+    path = tmp_path / name
+    path.write_bytes(text.encode())
+    return path
+
+
+def biopython_records(path: Path):
+    """Reference parsing, what FastaReader did before the mmap scanner."""
+    SimpleFastaParser = pytest.importorskip("Bio.SeqIO.FastaIO").SimpleFastaParser
+    with open(path, newline="") as handle:
+        return [(title.split(None, 1)[0], seq.upper()) for title, seq in SimpleFastaParser(handle)]
+
+
+# ----------------------------------------------------------------------
+# MMAP FASTA PARSER
+# ----------------------------------------------------------------------
+FASTA_CASES = {
+    "lf": ">sp|P1|A_HUMAN\nACDE\nFGHI\n>sp|P2|B_HUMAN\nKLMN\n",
+    "crlf": ">sp|P1|A_HUMAN\r\nACDE\r\nFGHI\r\n>sp|P2|B_HUMAN\r\nKLMN\r\n",
+    "blank_lines": "\n>sp|P1|A_HUMAN\nACDE\n\nFGHI\n\n>sp|P2|B_HUMAN\n\nKLMN\n\n",
+    "no_trailing_newline": ">sp|P1|A_HUMAN\nACDE\nFGHI\n>sp|P2|B_HUMAN\nKLMN",
+    "descriptions": ">sp|P1|A_HUMAN Protein A OS=Homo sapiens OX=9606\nACDE\nFGHI\n>sp|P2|B_HUMAN Protein B>C\nKLMN\n",
+    "lowercase_and_spaces": ">sp|P1|A_HUMAN\nacde \nFGhi\n>sp|P2|B_HUMAN\nKL MN\n",
+}
+
+
+@pytest.mark.parametrize("case", sorted(FASTA_CASES))
+def test_mmap_parser_matches_biopython(tmp_path, case):
+    path = write_fasta(tmp_path, FASTA_CASES[case])
+
+    identifiers, sequences = _read_fasta_mmap(path)
+
+    assert identifiers == ["sp|P1|A_HUMAN", "sp|P2|B_HUMAN"]
+    assert sequences == ["ACDEFGHI", "KLMN"]
+    assert list(zip(identifiers, sequences)) == biopython_records(path)
+
+
+def test_mmap_parser_empty_file(tmp_path):
+    path = write_fasta(tmp_path, "")
+    assert _read_fasta_mmap(path) == ([], [])
+
+
+def test_mmap_parser_text_before_first_record(tmp_path):
+    path = write_fasta(tmp_path, "some comment\n>P1\nACD\n")
+    assert _read_fasta_mmap(path) == (["P1"], ["ACD"])
+
+
+def test_mmap_parser_header_without_sequence(tmp_path):
+    path = write_fasta(tmp_path, ">P1\n>P2\nACD\n>P3")
+    assert _read_fasta_mmap(path) == (["P1", "P2", "P3"], ["", "ACD", ""])
+
+
+@pytest.mark.parametrize("text, offset", [(">\nACD\n>P2\nKLM\n", 0), (">P1\nACD\n> \r\nKLM\n", 8)])
+def test_mmap_parser_empty_header(tmp_path, text, offset):
+    path = write_fasta(tmp_path, text)
+
+    with pytest.raises(ValueError, match=f"Empty FASTA header at byte offset {offset}"):
+        _read_fasta_mmap(path)
+
+    # FastaReader logs the error and returns nothing
+    assert list(read_file(str(path), SequenceRole.TARGET)) == []
+    assert read_file_columnar(str(path), SequenceRole.TARGET) == ([], [])
+
+
+# ----------------------------------------------------------------------
+# FASTA READER
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("case", sorted(FASTA_CASES))
+def test_fasta_reader_read_and_columns_agree(tmp_path, case):
+    path = write_fasta(tmp_path, FASTA_CASES[case])
+
+    inputs = list(read_file(str(path), SequenceRole.TARGET))
+    accessions, sequences = read_file_columnar(str(path), SequenceRole.TARGET)
+
+    assert [obj.accession for obj in inputs] == accessions == ["P1", "P2"]
+    assert [obj.sequence for obj in inputs] == sequences == ["ACDEFGHI", "KLMN"]
+
+
+def test_fasta_reader_empty_file(tmp_path):
+    path = write_fasta(tmp_path, "")
+
+    assert list(read_file(str(path), SequenceRole.QUERY)) == []
+    assert read_file_columnar(str(path), SequenceRole.QUERY) == ([], [])
+
+
+def test_fasta_reader_missing_file(tmp_path):
+    reader = FastaReader(str(tmp_path / "missing.fasta"), SequenceRole.TARGET)
+
+    assert list(reader.read()) == []
+    assert reader.read_columns() == ([], [])
+
+
+
+# ----------------------------------------------------------------------
+# TABULAR READER
+# ----------------------------------------------------------------------
+def write_table(tmp_path: Path, rows, name: str = "input.csv", sep: str = ",") -> Path:
+    path = tmp_path / name
+    path.write_text("\n".join(sep.join(row) for row in rows) + "\n")
+    return path
+
+
+TABLE_ROWS = [
+    ("accession", "comment", "sequence"),
+    ("P1", "first", " acd "),
+    ("P2", "", "KLM"),
+    ("NA", "third", "ACDEF"), # "NA" is a missing value for pandas
+    ("P4", "fourth", ""),
+    ("1234", "numeric", "kl"), # Read as text, not as an int
+]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"chunksize": 2}, {"workers": 2}, {"chunksize": 2, "workers": 3}],
+    ids=["single", "chunks", "workers", "chunks_and_workers"],
+)
+@pytest.mark.parametrize("name, sep", [("input.csv", ","), ("input.tsv", "\t")])
+def test_tabular_reader_read_and_columns_agree(tmp_path, kwargs, name, sep):
+    path = write_table(tmp_path, TABLE_ROWS, name, sep)
+
+    inputs = list(read_file(str(path), SequenceRole.QUERY, **kwargs))
+    accessions, sequences = read_file_columnar(str(path), SequenceRole.QUERY, **kwargs)
+
+    # Extra columns are ignored, missing accessions are None, empty sequences ""
+    assert [obj.accession for obj in inputs] == list(accessions) == ["P1", "P2", None, "P4", "1234"]
+    assert [obj.sequence for obj in inputs] == list(sequences) == ["ACD", "KLM", "ACDEF", "", "KL"]
+
+
+def test_tabular_reader_missing_values_fail_validation(tmp_path):
+    path = write_table(tmp_path, [("accession", "sequence"), ("P1", "ACD"), ("P2", "")])
+    accessions, sequences = read_file_columnar(str(path), SequenceRole.QUERY)
+
+    with pytest.raises(ValueError, match="SequenceInput.sequence cannot be empty."):
+        validate_query_columns(accessions, sequences)
+
+    path = write_table(tmp_path, [("accession", "sequence"), ("P1", "ACD"), ("", "KLM")])
+    accessions, sequences = read_file_columnar(str(path), SequenceRole.QUERY)
+
+    with pytest.raises(ValueError, match="QueryInput.accession cannot be empty."):
+        validate_query_columns(accessions, sequences)
+
+
+def test_tabular_reader_missing_column(tmp_path):
+    path = write_table(tmp_path, [("accession", "peptide"), ("P1", "ACD")])
+
+    assert list(read_file(str(path), SequenceRole.QUERY)) == []
+    assert read_file_columnar(str(path), SequenceRole.QUERY) == ([], [])
+
+
+# ----------------------------------------------------------------------
+# XLSX READER
+# ----------------------------------------------------------------------
+@pytest.fixture
+def xlsx_file(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["accession", "sequence"])
+    ws.append(["P1", " acd "])
+    ws.append(["P2", "KLM"])
+    ws.append([None, None]) # Blank row
+    ws.append(["P4", None]) # Blank sequence cell
+    ws.append(["P5", "ACDEF "])
+
+    path = tmp_path / "input.xlsx"
+    wb.save(path)
+    return path
+
+
+@pytest.mark.parametrize("engine", ["calamine", "openpyxl"])
+def test_xlsx_reader_blank_rows_and_cells(xlsx_file, engine):
+    if engine == "calamine":
+        pytest.importorskip("python_calamine")
+
+    inputs = list(read_file(str(xlsx_file), SequenceRole.QUERY, engine=engine))
+    accessions, sequences = read_file_columnar(str(xlsx_file), SequenceRole.QUERY, engine=engine)
+
+    # Blank rows are skipped, a blank sequence cell stays empty (never "NONE")
+    assert [(obj.accession, obj.sequence) for obj in inputs] == [
+        ("P1", "ACD"), ("P2", "KLM"), ("P4", ""), ("P5", "ACDEF")
+    ]
+    assert accessions == ["P1", "P2", "P4", "P5"]
+    assert sequences == ["ACD", "KLM", "", "ACDEF"]
+
+    with pytest.raises(ValueError, match="SequenceInput.sequence cannot be empty."):
+        validate_query_columns(accessions, sequences)
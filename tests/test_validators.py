@@ -0,0 +1,122 @@
+import pytest
+
+from microtpct.io.schema import TargetInput, QueryInput
+from microtpct.io.validators import (
+    _records_with_unknown_residues,
+    validate_query_columns,
+    validate_query_input,
+    validate_query_inputs_batch,
+    validate_target_columns,
+    validate_target_input,
+    validate_target_inputs_batch,
+)
+
+
+# ----------------------------------------------------------------------
+# HELPERS
+# ----------------------------------------------------------------------
+def outcome(func, *args, **kwargs):
+    """Result of func, or the type and message of the error it raised."""
+    try:
+        return ("ok", func(*args, **kwargs))
+    except (ValueError, TypeError) as e:
+        return (type(e).__name__, str(e))
+
+
+def per_record_targets(accessions, sequences, **kwargs):
+    return [
+        validate_target_input(TargetInput(accession=acc, sequence=seq), **kwargs)
+        for acc, seq in zip(accessions, sequences)
+    ]
+
+
+def per_record_queries(accessions, sequences, **kwargs):
+    for acc, seq in zip(accessions, sequences):
+        validate_query_input(QueryInput(accession=acc, sequence=seq), **kwargs)
+
+
+def batch_targets(accessions, sequences, **kwargs):
+    targets = [TargetInput(accession=acc, sequence=seq) for acc, seq in zip(accessions, sequences)]
+    return validate_target_inputs_batch(targets, **kwargs)
+
+
+def batch_queries(accessions, sequences, **kwargs):
+    queries = [QueryInput(accession=acc, sequence=seq) for acc, seq in zip(accessions, sequences)]
+    return validate_query_inputs_batch(queries, **kwargs)
+
+
+TARGET_CASES = {
+    "clean": (["P1", "P2"], ["ACDEFGHIK", "LMNPQRSTVWY"], {}),
+    "rare_residues": (["P1"], ["ACDOU"], {}),
+    "invalid_residue": (["P1", "P2", "P3"], ["ACD", "ACZB1", "KLM"], {}),
+    "non_ascii": (["P1", "P2"], ["ACD", "ACDÉ"], {}),
+    "wildcards": (["P1", "P2", "P3"], ["ACXD", "ACD", "X"], {"wildcards": {"X"}}),
+    "wildcard_not_allowed": (["P1", "P2"], ["ACD", "ACXD"], {}),
+    "lowercase_normalized": (["P1", "P2"], ["acdef", "klm"], {"normalized": True}),
+    "lowercase_wildcard_normalized": (["P1", "P2"], ["acxd", "KLM"], {"wildcards": {"X"}, "normalized": True}),
+    "lowercase_invalid_normalized": (["P1"], ["acdz"], {"normalized": True}),
+    "empty_sequence": (["P1", "P2"], ["ACD", ""], {}),
+    "empty_accession": (["P1", ""], ["ACD", "KLM"], {}),
+}
+
+QUERY_CASES = {
+    name: (accessions, sequences, {k: v for k, v in kwargs.items() if k != "wildcards"})
+    for name, (accessions, sequences, kwargs) in TARGET_CASES.items()
+}
+
+
+# ----------------------------------------------------------------------
+# BATCH AND COLUMN VALIDATORS AGREE WITH THE PER-RECORD ONES
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("case", sorted(TARGET_CASES))
+def test_target_validators_agree(case):
+    accessions, sequences, kwargs = TARGET_CASES[case]
+
+    expected = outcome(per_record_targets, accessions, sequences, **kwargs)
+
+    assert outcome(batch_targets, accessions, sequences, **kwargs) == expected
+    assert outcome(validate_target_columns, accessions, sequences, **kwargs) == expected
+
+
+@pytest.mark.parametrize("case", sorted(QUERY_CASES))
+def test_query_validators_agree(case):
+    accessions, sequences, kwargs = QUERY_CASES[case]
+
+    expected = outcome(per_record_queries, accessions, sequences, **kwargs)
+
+    assert outcome(batch_queries, accessions, sequences, **kwargs) == expected
+    assert outcome(validate_query_columns, accessions, sequences, **kwargs) == expected
+
+
+def test_wildcard_flags():
+    accessions, sequences, kwargs = TARGET_CASES["wildcards"]
+    assert validate_target_columns(accessions, sequences, **kwargs) == [True, False, True]
+
+
+def test_invalid_residue_message():
+    with pytest.raises(ValueError, match=r"Invalid amino acids found for object 'P2': 1, B, Z"):
+        validate_target_columns(["P1", "P2"], ["ACD", "ACZB1"])
+
+
+def test_empty_sequence_message():
+    with pytest.raises(ValueError, match="SequenceInput.sequence cannot be empty."):
+        validate_query_columns(["Q1"], [""])
+
+
+# ----------------------------------------------------------------------
+# ONE PASS RESIDUE SCAN
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "sequences, expected",
+    [
+        ([], []),
+        (["ACD", "KLM"], []),
+        (["acd", "klm"], []), # Lowercase residues are valid bytes
+        (["ACD", "AXD", "KLM", "Z"], [1, 3]),
+        (["", "ACD", "?"], [2]),
+        (["ACD", "AÉ", "KLM"], [1]), # Non ASCII, per-record fallback
+        (["AC\x00D", "KLM"], [0]), # Separator byte inside a record
+    ],
+)
+def test_records_with_unknown_residues(sequences, expected):
+    assert _records_with_unknown_residues(sequences) == expected
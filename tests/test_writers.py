@@ -0,0 +1,277 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from microtpct.core.databases import QueryDB, TargetDB
+from microtpct.core.results import Match, MatchResult
+from microtpct.io.writers import (
+    MATCHING_TYPES,
+    build_matching_result_table,
+    compute_matching_statistics,
+    write_outputs,
+)
+
+
+RESULT_COLUMNS = [
+    "accession",
+    "sequence",
+    "ambiguous_il_sequence",
+    "strict_matching_target_accession",
+    "strict_matching_position",
+    "wildcard_matching_target_accession",
+    "wildcard_matching_position",
+    "matching_type",
+]
+
+
+# ----------------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------------
+@pytest.fixture
+def target_db():
+    return TargetDB(
+        ids=["T1", "T2", "T3"],
+        sequences=["ACDKLM", "KLMNCD", "XXXX"],
+        ambiguous_il_sequences=["ACDKJM", "KJMNCD", "XXXX"],
+        accessions=["P1", "P2", "P3"],
+    )
+
+
+@pytest.fixture
+def query_db():
+    return QueryDB(
+        ids=["Q1", "Q2", "Q3", "Q4"],
+        sequences=["CD", "KLM", "ACD", "WWW"],
+        ambiguous_il_sequences=["CD", "KJM", "ACD", "WWW"],
+        accessions=["pep1", "pep2", "pep3", "pep4"],
+    )
+
+
+@pytest.fixture
+def result_strict():
+    # Not in query order on purpose, Q1 matches kept in this order
+    return MatchResult([
+        Match("Q3", "T1", 0),
+        Match("Q1", "T2", 4),
+        Match("Q1", "T1", 1),
+    ])
+
+
+@pytest.fixture
+def result_wildcard():
+    return MatchResult([
+        Match("Q2", "T3", 0),
+        Match("Q1", "T3", 2),
+    ])
+
+
+def rows(df):
+    """Result table as plain tuples, missing values as None."""
+    return [
+        tuple(None if pd.isna(value) else value for value in row)
+        for row in df[[
+            "accession",
+            "strict_matching_target_accession",
+            "strict_matching_position",
+            "wildcard_matching_target_accession",
+            "wildcard_matching_position",
+            "matching_type",
+        ]].itertuples(index=False, name=None)
+    ]
+
+
+# ----------------------------------------------------------------------
+# RESULT TABLE
+# ----------------------------------------------------------------------
+def test_result_table_rows_and_order(query_db, target_db, result_strict, result_wildcard):
+    df = build_matching_result_table(query_db, target_db, result_strict, result_wildcard)
+
+    assert list(df.columns) == RESULT_COLUMNS
+    assert list(df.index) == list(range(len(df)))
+
+    # Query order, strict rows before wildcard rows of the same query
+    assert rows(df) == [
+        ("pep1", "P2", 4, None, None, "strict"),
+        ("pep1", "P1", 1, None, None, "strict"),
+        ("pep1", None, None, "P3", 2, "wildcard"),
+        ("pep2", None, None, "P3", 0, "wildcard"),
+        ("pep3", "P1", 0, None, None, "strict"),
+        ("pep4", None, None, None, None, "no_match"),
+    ]
+
+    # Query metadata follows its row
+    assert df["sequence"].tolist() == ["CD", "CD", "CD", "KLM", "ACD", "WWW"]
+    assert df["ambiguous_il_sequence"].tolist() == ["CD", "CD", "CD", "KJM", "ACD", "WWW"]
+
+
+def test_result_table_without_wildcard(query_db, target_db, result_strict):
+    df = build_matching_result_table(query_db, target_db, result_strict)
+
+    assert rows(df) == [
+        ("pep1", "P2", 4, None, None, "strict"),
+        ("pep1", "P1", 1, None, None, "strict"),
+        ("pep2", None, None, None, None, "no_match"),
+        ("pep3", "P1", 0, None, None, "strict"),
+        ("pep4", None, None, None, None, "no_match"),
+    ]
+
+
+def test_result_table_dtypes(query_db, target_db, result_strict, result_wildcard):
+    df = build_matching_result_table(query_db, target_db, result_strict, result_wildcard)
+
+    assert df["strict_matching_position"].dtype == "Int64"
+    assert df["wildcard_matching_position"].dtype == "Int64"
+
+    for col in ("strict_matching_target_accession", "wildcard_matching_target_accession"):
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert list(df[col].cat.categories) == ["P1", "P2", "P3"]
+
+    assert isinstance(df["matching_type"].dtype, pd.CategoricalDtype)
+    assert tuple(df["matching_type"].cat.categories) == MATCHING_TYPES
+
+
+def test_result_table_empty_match_result(query_db, target_db):
+    df = build_matching_result_table(query_db, target_db, MatchResult([]), MatchResult([]))
+
+    assert list(df.columns) == RESULT_COLUMNS
+    assert df["accession"].tolist() == ["pep1", "pep2", "pep3", "pep4"]
+    assert df["matching_type"].tolist() == ["no_match"] * 4
+    assert df["strict_matching_position"].isna().all()
+    assert df["strict_matching_position"].dtype == "Int64"
+
+
+def test_result_table_only_matches(target_db):
+    query_db = QueryDB(ids=["Q1"], sequences=["CD"], ambiguous_il_sequences=["CD"], accessions=["pep1"])
+
+    df = build_matching_result_table(query_db, target_db, MatchResult([Match("Q1", "T1", 1)]))
+
+    assert rows(df) == [("pep1", "P1", 1, None, None, "strict")]
+
+
+def test_result_table_no_queries(target_db):
+    query_db = QueryDB(ids=[], sequences=[], ambiguous_il_sequences=[], accessions=[])
+
+    df = build_matching_result_table(query_db, target_db, MatchResult([]))
+
+    assert list(df.columns) == RESULT_COLUMNS
+    assert df.empty
+
+
+# ----------------------------------------------------------------------
+# STATISTICS
+# ----------------------------------------------------------------------
+def test_matching_statistics(query_db, target_db, result_strict, result_wildcard):
+    df = compute_matching_statistics(
+        query_db, target_db, result_strict, result_wildcard,
+        n_target_with_wildcards=0,
+        matching_engine="find",
+        allow_wildcard=True,
+        wildcards={"X"},
+        timestamp=datetime(2025, 1, 2, 3, 4, 5),
+        analysis_name="test",
+    )
+    stats = dict(zip(df["metric"], df["value"]))
+
+    assert list(df.columns) == ["source", "metric", "value"]
+    assert stats["timestamp"] == "2025-01-02T03:04:05"
+    assert stats["n_total_matches"] == 5
+    assert stats["n_strict_matches"] == 3
+    assert stats["n_wildcard_matches"] == 2
+    assert stats["n_unique_queries_with_match"] == 3
+    assert stats["max_matches_per_unique_query"] == 3 # Q1: 2 strict + 1 wildcard
+    assert stats["n_targets_hit"] == 3
+    assert stats["n_unique_queries_with_strict_match"] == 2
+    assert stats["n_unique_queries_with_wildcard_match"] == 2
+    assert stats["n_queries_rescued_by_wildcard"] == 1 # Q2
+
+
+def test_matching_statistics_empty_results(query_db, target_db):
+    df = compute_matching_statistics(
+        query_db, target_db, MatchResult([]), None,
+        n_target_with_wildcards=0,
+        matching_engine="find",
+        allow_wildcard=False,
+        wildcards=None,
+        timestamp=datetime(2025, 1, 2),
+    )
+    stats = dict(zip(df["metric"], df["value"]))
+
+    assert stats["n_total_matches"] == 0
+    assert stats["mean_matches_per_unique_query"] == 0.0
+    assert stats["max_queries_per_target_with_match"] == 0
+    assert "n_wildcard_matches" not in stats
+
+
+# ----------------------------------------------------------------------
+# WRITE OUTPUTS
+# ----------------------------------------------------------------------
+def run_write_outputs(tmp_path, output_format, query_db, target_db, result_strict, result_wildcard):
+    return write_outputs(
+        tmp_path, output_format, query_db, target_db, result_strict, result_wildcard,
+        n_target_with_wildcards=0,
+        matching_engine="find",
+        allow_wildcard=True,
+        wildcards={"X"},
+        analysis_name="Analyse protéome",
+        timestamp=datetime(2025, 1, 2, 3, 4, 5),
+    )
+
+
+def test_write_outputs_csv_round_trip(tmp_path, query_db, target_db, result_strict, result_wildcard):
+    result_file, stats_file = run_write_outputs(tmp_path, "csv", query_db, target_db, result_strict, result_wildcard)
+
+    assert result_file.name == "microtpct_matching_result_analyse_protome_20250102_030405.csv"
+    assert stats_file.name == "microtpct_statistics_analyse_protome_20250102_030405.csv"
+
+    expected = build_matching_result_table(query_db, target_db, result_strict, result_wildcard)
+    written = pd.read_csv(result_file, encoding="utf-8", dtype={
+        "strict_matching_position": "Int64",
+        "wildcard_matching_position": "Int64",
+    })
+
+    assert list(written.columns) == RESULT_COLUMNS
+    assert rows(written) == rows(expected)
+
+    stats = pd.read_csv(stats_file, encoding="utf-8")
+    assert dict(zip(stats["metric"], stats["value"]))["analysis_name"] == "Analyse protéome"
+
+
+def test_write_outputs_excel_round_trip(tmp_path, query_db, target_db, result_strict, result_wildcard):
+    pytest.importorskip("openpyxl")
+
+    result_file, stats_file = run_write_outputs(tmp_path, "excel", query_db, target_db, result_strict, result_wildcard)
+
+    assert result_file.suffix == stats_file.suffix == ".xlsx"
+
+    expected = build_matching_result_table(query_db, target_db, result_strict, result_wildcard)
+    written = pd.read_excel(result_file, sheet_name="results", engine="openpyxl", dtype={
+        "strict_matching_position": "Int64",
+        "wildcard_matching_position": "Int64",
+    })
+
+    assert list(written.columns) == RESULT_COLUMNS
+    assert rows(written) == rows(expected)
+
+    stats = pd.read_excel(stats_file, sheet_name="statistics", engine="openpyxl")
+    assert dict(zip(stats["metric"], stats["value"]))["n_total_matches"] == 5
+
+
+def test_write_csv_falls_back_when_arrow_write_fails(tmp_path, monkeypatch, query_db, target_db, result_strict):
+    pa = pytest.importorskip("pyarrow")
+    pa_csv = pytest.importorskip("pyarrow.csv")
+    from microtpct.io.writers import _write_csv
+
+    def failing_write_csv(table, path, **kwargs):
+        with open(path, "w") as fh:
+            fh.write("partial")
+        raise pa.ArrowNotImplementedError("dictionary columns not supported")
+
+    monkeypatch.setattr(pa_csv, "write_csv", failing_write_csv)
+
+    df = build_matching_result_table(query_db, target_db, result_strict)
+    path = tmp_path / "result.csv"
+    _write_csv(df, path, prefer_arrow=True)
+
+    written = pd.read_csv(path, dtype={"strict_matching_position": "Int64", "wildcard_matching_position": "Int64"})
+    assert rows(written) == rows(df)